@@ -8,19 +8,23 @@ Features:
 """
 
 import sys
-import time
+import copy
 import json
+import time
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
+from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor
 
 import streamlit as st
+import streamlit.components.v1 as components
 import folium
 from folium.plugins import Draw
 from streamlit_folium import st_folium
 from dotenv import load_dotenv
-import plotly.graph_objects as go
-import plotly.express as px
 
 # Import translations
 from translations import LANGUAGES, t, get_text
@@ -40,8 +44,15 @@ else:
     load_dotenv()
 
 # Service Imports
-try:
-    import services.satellite_service as satellite_service
+from services.cache_utils import UncachedResult
+
+# The satellite stack (pystac, stackstac, xarray) and the LLM/RAG clients are
+# only needed from the processing step on, so they are imported on first use
+# and the location page paints without waiting for them. The namespace lives in
+# st.cache_resource because this script, and any lru_cache in it, is re-executed
+# on every rerun.
+@st.cache_resource(show_spinner=False)
+def _backend() -> SimpleNamespace:
     import services.weather_service as weather_service
     from services import llm_service
     from services.advanced_satellite_service import (
@@ -61,11 +72,207 @@ try:
     from services.analysis_service import (
         generate_metric_explanations,
     )
-    SERVICES_AVAILABLE = True
-except ImportError as e:
-    st.error(f"Backend Import Error: {e}")
-    SERVICES_AVAILABLE = False
-    st.stop()
+    return SimpleNamespace(
+        weather_service=weather_service,
+        llm_service=llm_service,
+        get_multi_temporal_ndvi=get_multi_temporal_ndvi,
+        check_deforestation=check_deforestation,
+        calculate_sustainability_score=calculate_sustainability_score,
+        calculate_loan_risk_score=calculate_loan_risk_score,
+        create_green_certificate=create_green_certificate,
+        generate_blockchain_hash=generate_blockchain_hash,
+        get_compliance_context=get_compliance_context,
+        get_index=get_index,
+        generate_metric_explanations=generate_metric_explanations,
+    )
+
+
+def load_backend() -> SimpleNamespace:
+    """Return the backend services, stopping the page if they can't be imported."""
+    try:
+        return _backend()
+    except ImportError as e:
+        st.error(f"Backend Import Error: {e}")
+        st.stop()
+
+
+# ---------------------------------------------------------------------------
+# Cached Service Calls
+# ---------------------------------------------------------------------------
+# Going Back from the loan form and resubmitting for the same farm reuses
+# these instead of repeating the satellite, weather and LLM requests.
+# Callers round coordinates to 4 decimals (~10 m) so nearby clicks share entries.
+
+# Satellite history changes on the scale of days, so it is kept on disk across
+# restarts. Disk-persisted caches ignore ttl and max_entries only bounds the
+# in-memory layer, so entries are keyed on the date and the whole store is
+# cleared once the date moves on. Mock fallbacks (API down) are raised out
+# rather than stored.
+@st.cache_data(persist="disk", max_entries=256, show_spinner=False)
+def _stored_ndvi(lat: float, lon: float, polygon: Optional[List[List[float]]], day: str) -> Dict[str, Any]:
+    data = _backend().get_multi_temporal_ndvi(lat, lon, months_back=6, polygon=polygon)
+    if data.get("is_mock"):
+        raise UncachedResult(data)
+    return data
+
+
+@st.cache_data(persist="disk", max_entries=256, show_spinner=False)
+def _stored_deforestation(lat: float, lon: float, polygon: Optional[List[List[float]]], day: str) -> Dict[str, Any]:
+    data = _backend().check_deforestation(lat, lon, years_back=2, polygon=polygon)
+    if data.get("is_mock"):
+        raise UncachedResult(data)
+    return data
+
+
+@st.cache_data(persist="disk", show_spinner=False)
+def _stored_day() -> str:
+    # Remembers, on disk, the date the stored satellite entries were written on
+    return datetime.now().strftime("%Y-%m-%d")
+
+
+def _storage_day() -> str:
+    """Today's date, after dropping satellite entries stored on earlier days."""
+    today = datetime.now().strftime("%Y-%m-%d")
+    if _stored_day() != today:
+        _stored_ndvi.clear()
+        _stored_deforestation.clear()
+        _stored_day.clear()
+        _stored_day()
+    return today
+
+
+def _cached_ndvi(lat: float, lon: float, polygon: Optional[List[List[float]]]) -> Dict[str, Any]:
+    try:
+        return _stored_ndvi(lat, lon, polygon, _storage_day())
+    except UncachedResult as e:
+        return e.data
+
+
+def _cached_deforestation(lat: float, lon: float, polygon: Optional[List[List[float]]]) -> Dict[str, Any]:
+    try:
+        return _stored_deforestation(lat, lon, polygon, _storage_day())
+    except UncachedResult as e:
+        return e.data
+
+
+@st.cache_data(ttl=1800, max_entries=256, show_spinner=False)
+def _stored_weather(lat: float, lon: float) -> Dict[str, Any]:
+    # Error fallbacks (API down) are raised out so the next call retries
+    data = _backend().weather_service.get_weather_analysis(lat, lon)
+    if "error" in data:
+        raise UncachedResult(data)
+    return data
+
+
+def _cached_weather(lat: float, lon: float) -> Dict[str, Any]:
+    try:
+        return _stored_weather(lat, lon)
+    except UncachedResult as e:
+        return e.data
+
+
+# The loan analysis streams its draft into a page element, and st.cache_data
+# replays element calls made inside a cached function, which fails for an
+# element created outside it. So results are memoized in a plain LRU store and
+# the callback only ever runs on a miss.
+_LOAN_ANALYSIS_TTL = 3600
+_LOAN_ANALYSIS_MAX_ENTRIES = 256
+
+
+@st.cache_resource(show_spinner=False)
+def _loan_analysis_store() -> SimpleNamespace:
+    # `lock` guards both dicts; `key_locks` holds, per key being computed, a
+    # lock and the number of sessions holding or waiting on it
+    return SimpleNamespace(lock=threading.Lock(), entries=OrderedDict(), key_locks={})
+
+
+def _cached_loan_analysis(
+    combined_data: Dict[str, Any],
+    purpose: Optional[str],
+    language: str,
+    regulatory_context: Optional[str],
+    on_text: Optional[Callable[[str], None]] = None,
+) -> Dict[str, Any]:
+    key = json.dumps([combined_data, purpose, language, regulatory_context], sort_keys=True, default=str)
+    store = _loan_analysis_store()
+    with store.lock:
+        key_lock = store.key_locks.setdefault(key, SimpleNamespace(lock=threading.Lock(), waiters=0))
+        key_lock.waiters += 1
+    
+    # Sessions missing on the same key wait for the first one's LLM call
+    # instead of each paying for their own. The lock is dropped only once no
+    # session holds or waits on it (finally also covers Streamlit's rerun and
+    # stop exceptions), so a later caller never gets a second lock for a key
+    # that is still being computed.
+    try:
+        with key_lock.lock:
+            with store.lock:
+                hit = store.entries.get(key)
+                if hit is not None and time.monotonic() - hit[0] < _LOAN_ANALYSIS_TTL:
+                    store.entries.move_to_end(key)
+                    # Copies keep sessions from sharing (and mutating) the stored result
+                    return copy.deepcopy(hit[1])
+            
+            # Exceptions are not stored, so after a failed call the next
+            # waiter (or the next run) makes its own attempt
+            result = _backend().llm_service.analyze_loan_risk(
+                combined_data,
+                user_request=purpose,
+                language=language,
+                regulatory_context=regulatory_context,
+                on_text=on_text
+            )
+            
+            with store.lock:
+                store.entries[key] = (time.monotonic(), result)
+                store.entries.move_to_end(key)
+                while len(store.entries) > _LOAN_ANALYSIS_MAX_ENTRIES:
+                    store.entries.popitem(last=False)
+    finally:
+        with store.lock:
+            key_lock.waiters -= 1
+            if not key_lock.waiters:
+                del store.key_locks[key]
+    return copy.deepcopy(result)
+
+
+def _certificate_farm_data(temporal_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Farm fields that go into the verification hash and the certificate."""
+    return {"ndvi_score": temporal_data.get("ndvi_current", 0.5), "status": "Verified"}
+
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def _cached_certificate_pdf(tx_hash: str, farm_data: Dict[str, Any], decision_data: Dict[str, Any]) -> bytes:
+    # One ReportLab build per verification hash; reruns of the results page reuse the bytes
+    pdf_path, _ = _backend().create_green_certificate(farm_data, decision_data, ledger_hash=tx_hash)
+    return Path(pdf_path).read_bytes()
+
+
+# ---------------------------------------------------------------------------
+# Display Constants
+# ---------------------------------------------------------------------------
+# Wizard step indicator: one template per element, filled in by _progress_html
+_PROGRESS_STEP_TMPL = '<div class="progress-step {cls}">{label}</div>'
+_PROGRESS_LINE_TMPL = '<div class="progress-line {cls}"></div>'
+
+# Sustainability score component row (icon, label, bar, percentage)
+_COMPONENT_ROW_TMPL = """
+    <div class="component-row">
+        <div class="component-icon">{icon}</div>
+        <div class="component-name">{name}</div>
+        <div class="component-bar-container">
+            <div class="component-bar" style="width: {bar_width}%; background: {color};"></div>
+        </div>
+        <div class="component-value">{score}%</div>
+    </div>
+"""
+
+# Processing status line; styling lives in the .status-line rules so each
+# update only ships this short snippet
+_STATUS_LINE_TMPL = (
+    '<div class="status-line"><span class="status-icon">{icon}</span>'
+    '<span class="status-text">{text}</span></div>'
+)
 
 
 # ---------------------------------------------------------------------------
@@ -79,179 +286,8 @@ def setup_page():
         initial_sidebar_state="collapsed"
     )
     
-    st.markdown("""
-        <style>
-        @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&display=swap');
-        
-        * { font-family: 'Inter', sans-serif; }
-        
-        .block-container { 
-            padding: 2rem 3rem; 
-            max-width: 1200px; 
-        }
-        #MainMenu, footer, header { visibility: hidden; }
-        
-        /* Brand */
-        .brand {
-            text-align: center;
-            padding: 1rem 0 2rem;
-        }
-        .brand-icon { font-size: 3rem; margin-bottom: 0.5rem; }
-        .brand-name { font-size: 1.5rem; font-weight: 700; color: #064e3b; letter-spacing: -0.5px; }
-        .brand-tagline { color: #6b7280; font-size: 0.9rem; }
-        .version-badge {
-            display: inline-block;
-            background: linear-gradient(135deg, #059669 0%, #047857 100%);
-            color: white;
-            font-size: 0.65rem;
-            padding: 0.2rem 0.5rem;
-            border-radius: 10px;
-            margin-left: 0.5rem;
-            vertical-align: super;
-        }
-        
-        /* Progress Steps */
-        .progress-container {
-            display: flex;
-            justify-content: center;
-            align-items: center;
-            margin: 2rem 0;
-            gap: 0.5rem;
-        }
-        .progress-step {
-            width: 40px;
-            height: 40px;
-            border-radius: 50%;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-weight: 600;
-            font-size: 0.9rem;
-            transition: all 0.3s;
-        }
-        .progress-step.completed { background: #059669; color: white; }
-        .progress-step.active {
-            background: #064e3b;
-            color: white;
-            transform: scale(1.1);
-            box-shadow: 0 4px 15px rgba(6, 78, 59, 0.4);
-        }
-        .progress-step.pending { background: #e5e7eb; color: #9ca3af; }
-        .progress-line { width: 60px; height: 3px; background: #e5e7eb; border-radius: 2px; }
-        .progress-line.completed { background: #059669; }
-
-        /* Override Streamlit blue halo */
-        .stApp {
-            background: #ffffff;
-        }
-        div[data-testid="stAppViewBlockContainer"] {
-            box-shadow: 0 10px 40px rgba(5, 150, 105, 0.08) !important;
-            border-radius: 24px;
-            background: white;
-            margin-top: 2rem;
-            margin-bottom: 2rem;
-            border: 1px solid #f0fdf4;
-        }
-        
-        /* Card Styles */
-        .card {
-            background: white;
-            border: 1px solid #e5e7eb;
-            border-radius: 16px;
-            padding: 2rem;
-            margin: 1rem 0;
-            box-shadow: 0 4px 20px rgba(0,0,0,0.05);
-        }
-        .card-title { font-size: 1.25rem; font-weight: 700; color: #111827; margin-bottom: 0.5rem; }
-        .card-subtitle { color: #6b7280; font-size: 0.9rem; margin-bottom: 1.5rem; }
-        
-        /* Score Card */
-        .score-card {
-            background: linear-gradient(135deg, #064e3b 0%, #047857 100%);
-            border-radius: 16px;
-            padding: 2rem;
-            color: white;
-            text-align: center;
-        }
-        .score-value { font-size: 4rem; font-weight: 800; line-height: 1; }
-        .score-grade { font-size: 1.5rem; font-weight: 600; opacity: 0.9; }
-        .score-label { font-size: 0.9rem; opacity: 0.8; margin-top: 0.5rem; }
-        
-        /* Component Score */
-        .component-row {
-            display: flex;
-            align-items: center;
-            padding: 0.75rem 0;
-            border-bottom: 1px solid #f3f4f6;
-        }
-        .component-icon { font-size: 1.5rem; width: 40px; }
-        .component-name { flex: 1; font-weight: 500; color: #374151; }
-        .component-bar-container { width: 120px; height: 8px; background: #e5e7eb; border-radius: 4px; margin: 0 1rem; }
-        .component-bar { height: 100%; border-radius: 4px; }
-        .component-value { width: 50px; text-align: right; font-weight: 600; color: #064e3b; }
-        
-        /* Risk/Positive Factor */
-        .factor-item {
-            display: flex;
-            align-items: center;
-            padding: 0.5rem 0.75rem;
-            border-radius: 8px;
-            margin: 0.25rem 0;
-            font-size: 0.9rem;
-        }
-        .factor-risk { background: #fef2f2; color: #991b1b; }
-        .factor-positive { background: #f0fdf4; color: #166534; }
-        
-        /* Result Styles */
-        .result-hero { text-align: center; padding: 2rem; }
-        .result-icon { font-size: 5rem; margin-bottom: 1rem; }
-        .result-title { font-size: 2rem; font-weight: 800; margin-bottom: 0.5rem; }
-        .result-title.approved { color: #059669; }
-        .result-title.conditional { color: #d97706; }
-        .result-title.rejected { color: #dc2626; }
-        
-        /* Stats Grid */
-        .stats-grid {
-            display: grid;
-            grid-template-columns: repeat(4, 1fr);
-            gap: 1rem;
-            margin: 1.5rem 0;
-        }
-        .stat-box {
-            background: #f9fafb;
-            border-radius: 12px;
-            padding: 1rem;
-            text-align: center;
-        }
-        .stat-value { font-size: 1.5rem; font-weight: 700; color: #064e3b; }
-        .stat-label { font-size: 0.75rem; color: #6b7280; text-transform: uppercase; letter-spacing: 0.5px; }
-        
-        /* Certificate Box */
-        .cert-box {
-            background: linear-gradient(135deg, #064e3b 0%, #047857 100%);
-            border-radius: 12px;
-            padding: 1.5rem;
-            color: white;
-            margin: 1rem 0;
-        }
-        .cert-title { font-weight: 600; margin-bottom: 0.5rem; }
-        .cert-hash {
-            font-family: monospace;
-            font-size: 0.75rem;
-            background: rgba(0,0,0,0.2);
-            padding: 0.5rem;
-            border-radius: 6px;
-            word-break: break-all;
-        }
-        
-        /* Map container */
-        iframe { border-radius: 12px !important; border: 2px solid #e5e7eb !important; }
-        
-        /* Hide streamlit elements */
-        div[data-testid="stDecoration"] { display: none; }
-        .stDeployButton { display: none; }
-        </style>
-    """, unsafe_allow_html=True)
+    # Served by Streamlit's static file server so the browser caches it across reruns and sessions
+    st.markdown('<link rel="stylesheet" href="app/static/greenchain.css">', unsafe_allow_html=True)
 
 
 # ---------------------------------------------------------------------------
@@ -275,9 +311,8 @@ def render_language_selector():
         )
         
         selected_lang = lang_options[lang_labels.index(selected_label)]
-        if selected_lang != st.session_state.language:
-            st.session_state.language = selected_lang
-            st.rerun()
+        # Set before anything translatable renders below, so no extra rerun is needed
+        st.session_state.language = selected_lang
 
 
 def render_brand():
@@ -292,24 +327,20 @@ def render_brand():
     """, unsafe_allow_html=True)
 
 
-def render_progress(current: int, total: int = 4):
-    steps_html = ""
+@st.cache_resource(show_spinner=False)
+def _progress_html(current: int, total: int) -> str:
+    """Step indicator markup; only a handful of (current, total) pairs ever occur."""
+    parts = []
     for i in range(1, total + 1):
-        if i < current:
-            step_class = "completed"
-            content = "✓"
-        elif i == current:
-            step_class = "active"
-            content = str(i)
-        else:
-            step_class = "pending"
-            content = str(i)
-        steps_html += f'<div class="progress-step {step_class}">{content}</div>'
+        state = "completed" if i < current else "active" if i == current else "pending"
+        parts.append(_PROGRESS_STEP_TMPL.format(cls=state, label="✓" if i < current else i))
         if i < total:
-            line_class = "completed" if i < current else ""
-            steps_html += f'<div class="progress-line {line_class}"></div>'
-    
-    st.markdown(f'<div class="progress-container">{steps_html}</div>', unsafe_allow_html=True)
+            parts.append(_PROGRESS_LINE_TMPL.format(cls="completed" if i < current else ""))
+    return f'<div class="progress-container">{"".join(parts)}</div>'
+
+
+def render_progress(current: int, total: int = 4):
+    st.markdown(_progress_html(current, total), unsafe_allow_html=True)
 
 
 def render_sustainability_score(sustainability: Dict[str, Any]):
@@ -337,18 +368,14 @@ def render_sustainability_score(sustainability: Dict[str, Any]):
         ("☁️", "Climate Resilience", components.get("climate_score", 0), "#8b5cf6"),
     ]
     
-    for icon, name, score, color in component_info:
-        bar_width = max(5, score)  # Minimum 5% for visibility
-        st.markdown(f"""
-            <div class="component-row">
-                <div class="component-icon">{icon}</div>
-                <div class="component-name">{name}</div>
-                <div class="component-bar-container">
-                    <div class="component-bar" style="width: {bar_width}%; background: {color};"></div>
-                </div>
-                <div class="component-value">{score}%</div>
-            </div>
-        """, unsafe_allow_html=True)
+    # All four rows go out as one markdown element
+    st.markdown("".join(
+        _COMPONENT_ROW_TMPL.format(
+            icon=icon, name=name, score=score, color=color,
+            bar_width=max(5, score)  # Minimum 5% for visibility
+        )
+        for icon, name, score, color in component_info
+    ), unsafe_allow_html=True)
     
     # Risk and positive factors
     col1, col2 = st.columns(2)
@@ -374,6 +401,9 @@ def render_sustainability_score(sustainability: Dict[str, Any]):
 
 def render_ndvi_trend_chart(temporal_data: Dict[str, Any]):
     """Render NDVI trend chart using Plotly."""
+    # Plotly is only needed on the results page
+    import plotly.graph_objects as go
+    
     monthly_data = temporal_data.get("monthly_data", [])
     
     if not monthly_data:
@@ -421,26 +451,308 @@ def render_ndvi_trend_chart(temporal_data: Dict[str, Any]):
     ndvi_change = temporal_data.get("ndvi_change", 0)
     
     if trend_direction == "improving":
-        icon, color = "📈", "#059669"
+        icon, css_class = "📈", "improving"
     elif trend_direction == "declining":
-        icon, color = "📉", "#dc2626"
+        icon, css_class = "📉", "declining"
     else:
-        icon, color = "➡️", "#6b7280"
+        icon, css_class = "➡️", "stable"
     
     st.markdown(f"""
-        <div style="text-align: center; padding: 1rem; background: #f9fafb; border-radius: 12px;">
-            <span style="font-size: 1.5rem;">{icon}</span>
-            <span style="font-weight: 600; color: {color}; margin-left: 0.5rem;">
+        <div class="trend-summary">
+            <span class="trend-icon">{icon}</span>
+            <span class="trend-label {css_class}">
                 Trend: {trend_direction.title()} ({ndvi_change:+.3f})
             </span>
         </div>
     """, unsafe_allow_html=True)
 
 
+# ---------------------------------------------------------------------------
+# Map Helpers
+# ---------------------------------------------------------------------------
+# Tile layer definitions for the picker map. Only the specs are shared:
+# folium elements carry their parent and element id, so each Map gets fresh ones.
+# Satellite is the visible base layer; the street map isn't added to the map
+# (show=False) until picked in the layer control, so it fetches no tiles before.
+_BASE_LAYERS = (
+    {
+        "tiles": "https://{s}.basemaps.cartocdn.com/light_all/{z}/{x}/{y}{r}.png",
+        "attr": "&copy; OpenStreetMap &copy; CARTO",
+        "name": "Clean Map",
+        "show": False,
+    },
+    {
+        "tiles": "https://server.arcgisonline.com/ArcGIS/rest/services/World_Imagery/MapServer/tile/{z}/{y}/{x}",
+        "attr": "Esri",
+        "name": "Satellite View",
+    },
+)
+
+# Pin for the selected point. Styles are inline because the marker renders
+# inside the map iframe, which doesn't load the page stylesheet.
+_MARKER_ICON_HTML = """
+    <div style="background: linear-gradient(135deg, #059669 0%, #047857 100%);
+        width: 36px; height: 36px; border-radius: 50% 50% 50% 0;
+        transform: rotate(-45deg); display: flex; align-items: center;
+        justify-content: center; box-shadow: 0 4px 12px rgba(5, 150, 105, 0.4);
+        border: 3px solid white;">
+        <span style="transform: rotate(45deg); font-size: 16px;">🌱</span>
+    </div>
+"""
+
+
+@st.cache_resource(max_entries=64, show_spinner=False)
+def build_location_map(
+    lat: float,
+    lon: float,
+    polygon: Optional[Tuple[Tuple[float, float], ...]] = None,
+    show_marker: bool = False,
+) -> folium.Map:
+    """
+    Build the location-picker map.
+    
+    Cached on its arguments so reruns that don't move the selection (preset
+    buttons, language switch, drawing events) reuse the same Map object.
+    """
+    # Create map with drawing tools
+    m = folium.Map(
+        location=[lat, lon],
+        zoom_start=3 if lat == 20.0 else 12,
+        tiles=None
+    )
+    
+    # Base layers
+    for layer in _BASE_LAYERS:
+        folium.TileLayer(**layer).add_to(m)
+    
+    folium.LayerControl().add_to(m)
+    
+    # Add drawing tools
+    draw = Draw(
+        draw_options={
+            'polygon': {
+                'shapeOptions': {
+                    'color': '#059669',
+                    'fillColor': '#059669',
+                    'fillOpacity': 0.3
+                }
+            },
+            'rectangle': {
+                'shapeOptions': {
+                    'color': '#059669',
+                    'fillColor': '#059669',
+                    'fillOpacity': 0.3
+                }
+            },
+            'marker': True,
+            'circlemarker': False,
+            'circle': False,
+            'polyline': False
+        },
+        edit_options={'edit': True, 'remove': True}
+    )
+    draw.add_to(m)
+    
+    # Show existing polygon or marker
+    if polygon:
+        folium.Polygon(
+            locations=[[p[1], p[0]] for p in polygon],  # Convert [lon, lat] to [lat, lon]
+            color='#059669',
+            fill=True,
+            fillColor='#059669',
+            fillOpacity=0.3,
+            popup="Farm Boundary"
+        ).add_to(m)
+    elif show_marker:
+        folium.Marker(
+            [lat, lon],
+            popup=f"Selected: {lat:.4f}, {lon:.4f}",
+            icon=folium.DivIcon(html=_MARKER_ICON_HTML, icon_size=(36, 36), icon_anchor=(18, 36))
+        ).add_to(m)
+    
+    # Render the figure once here so st_folium can skip it (render=False) on every rerun
+    m.get_root().render()
+    
+    return m
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _confirm_map_html(
+    lat: float,
+    lon: float,
+    polygon: Optional[Tuple[Tuple[float, float], ...]] = None,
+) -> str:
+    """Satellite view of the chosen farm, rendered to standalone HTML."""
+    m = folium.Map(location=[lat, lon], zoom_start=14 if polygon else 12, tiles=None)
+    folium.TileLayer(**_BASE_LAYERS[1]).add_to(m)
+    
+    if polygon:
+        folium.Polygon(
+            locations=[[p[1], p[0]] for p in polygon],  # Convert [lon, lat] to [lat, lon]
+            color='#059669',
+            fill=True,
+            fillColor='#059669',
+            fillOpacity=0.3
+        ).add_to(m)
+    else:
+        folium.Marker([lat, lon]).add_to(m)
+    
+    return m.get_root().render()
+
+
+def render_confirm_map(lat: float, lon: float, polygon: Optional[List[List[float]]] = None):
+    """Read-only map of the selected location: plain HTML, no component round-trip."""
+    polygon_key = tuple(map(tuple, polygon)) if polygon and len(polygon) >= 3 else None
+    components.html(_confirm_map_html(lat, lon, polygon_key), height=300)
+
+
+# Quick-select presets: label -> (lat, lon)
+_PRESET_LOCATIONS = {
+    "🇺🇸 Kansas, USA": (37.669, -100.749),
+    "🇮🇳 Punjab, India": (29.605, 76.273),
+    "🇧🇷 Goiás, Brazil": (-15.826, -47.921),
+    "🇰🇪 Nairobi, Kenya": (-1.286, 36.817),
+}
+
+
+def _apply_preset_location():
+    """on_change callback for the preset selector; runs before the rerun it triggers."""
+    choice = st.session_state.get("preset")
+    if choice is None:  # Clicking the selected preset again just deselects it
+        return
+    st.session_state.lat, st.session_state.lon = _PRESET_LOCATIONS[choice]
+    st.session_state.polygon = None  # Clear polygon for preset
+    st.session_state.pick_mode = False
+    _sync_coordinate_form()
+
+
+def _apply_map_selection():
+    """on_change callback for the picker map: store a drawn boundary or a clicked point."""
+    map_data = st.session_state.get("location_map") or {}
+    
+    # Check for drawn polygon
+    for drawing in map_data.get("all_drawings") or []:
+        if drawing.get("geometry", {}).get("type") == "Polygon":
+            coords = drawing["geometry"]["coordinates"][0]
+            st.session_state.polygon = coords
+            # Set center point
+            lats = [c[1] for c in coords]
+            lons = [c[0] for c in coords]
+            st.session_state.lat = round(sum(lats) / len(lats), 4)
+            st.session_state.lon = round(sum(lons) / len(lons), 4)
+            st.session_state.pick_mode = False
+            st.session_state.preset = None
+            st.session_state.location_changed = True
+            _sync_coordinate_form()
+            return
+    
+    # Handle click (if no polygon). Stored to 4 decimals (~10 m), so a click
+    # that lands within jitter of the current point isn't a new location
+    clicked = map_data.get("last_clicked")
+    if clicked and not st.session_state.get("polygon"):
+        clicked_lat, clicked_lon = round(clicked["lat"], 4), round(clicked["lng"], 4)
+        if (clicked_lat, clicked_lon) != (st.session_state.get("lat"), st.session_state.get("lon")):
+            st.session_state.lat = clicked_lat
+            st.session_state.lon = clicked_lon
+            st.session_state.pick_mode = False
+            st.session_state.preset = None
+            st.session_state.location_changed = True
+            _sync_coordinate_form()
+
+
+def _apply_typed_coordinates():
+    """on_click callback for the coordinate form's submit button."""
+    st.session_state.lat = round(st.session_state.coord_lat, 4)
+    st.session_state.lon = round(st.session_state.coord_lon, 4)
+    st.session_state.polygon = None
+    st.session_state.pick_mode = False
+    st.session_state.preset = None
+    _sync_coordinate_form()
+
+
+def _sync_coordinate_form():
+    """Show the current location in the coordinate form's inputs."""
+    # Keyed inputs ignore value= after their first render, so they are updated
+    # through their session state keys whenever the location changes
+    st.session_state.coord_lat = float(st.session_state.lat)
+    st.session_state.coord_lon = float(st.session_state.lon)
+
+
+def _set_pick_mode(enabled: bool):
+    st.session_state.pick_mode = enabled
+
+
+def _clear_boundary():
+    st.session_state.polygon = None
+    st.session_state.pick_mode = True
+
+
+# Navigation callbacks run before the rerun the click triggers, so the new
+# step renders straight away instead of after a second st.rerun()
+def _go_to_step(step: int):
+    st.session_state.step = step
+
+
+def _reset_application():
+    for key in ["step", "lat", "lon", "loan_purpose", "loan_amount", "result", "result_inputs", "polygon", "pick_mode", "preset", "coord_lat", "coord_lon"]:
+        if key in st.session_state:
+            del st.session_state[key]
+
+
 # ---------------------------------------------------------------------------
 # Pages
 # ---------------------------------------------------------------------------
 
+@st.fragment
+def _location_map_pane():
+    """
+    Map column of the location page.
+    
+    A fragment, so toggling pick mode and map events that don't change the
+    selection rerun only this pane instead of the whole page.
+    """
+    # A new location (set by _apply_map_selection) also changes the status and
+    # Continue button in the controls column, so only then rerun the whole page
+    if st.session_state.pop("location_changed", False):
+        st.rerun()
+    
+    st.markdown("**🗺️ Click to place marker OR draw polygon boundary**")
+    
+    current_lat = st.session_state.get("lat", 20.0)
+    current_lon = st.session_state.get("lon", 0.0)
+    
+    polygon = st.session_state.get("polygon")
+    has_point = "lat" in st.session_state and st.session_state.lat != 20.0
+    m = build_location_map(
+        current_lat,
+        current_lon,
+        polygon=tuple(map(tuple, polygon)) if polygon and len(polygon) >= 3 else None,
+        show_marker=has_point,
+    )
+    
+    # Once a location is chosen the map is view-only: with no returned
+    # objects, panning and zooming never round-trip to Python
+    pick_mode = st.session_state.get("pick_mode", not has_point)
+    
+    if not pick_mode:
+        st_folium(
+            m, height=450, width=None, key="location_map_view",
+            returned_objects=[], render=False
+        )
+        st.button(
+            "✏️ Change location", key="enter_pick_mode", use_container_width=True,
+            on_click=_set_pick_mode, args=(True,)
+        )
+    else:
+        # Clicks and drawings are applied in the on_change callback, so the
+        # fragment rerun the map triggers already renders the new selection
+        st_folium(
+            m, height=450, width=None, key="location_map",
+            returned_objects=["last_clicked", "all_drawings"],
+            render=False, on_change=_apply_map_selection
+        )
+
+
 def page_select_location():
     """Step 1: Location Selection with Polygon Drawing"""
     render_progress(1)
@@ -455,136 +767,33 @@ def page_select_location():
     col_map, col_controls = st.columns([1.5, 1], gap="large")
     
     with col_map:
-        st.markdown("**🗺️ Click to place marker OR draw polygon boundary**")
-        
-        current_lat = st.session_state.get("lat", 20.0)
-        current_lon = st.session_state.get("lon", 0.0)
-        
-        # Create map with drawing tools
-        m = folium.Map(
-            location=[current_lat, current_lon],
-            zoom_start=3 if current_lat == 20.0 else 12,
-            tiles=None
-        )
-        
-        # Base layers
-        folium.TileLayer(
-            tiles='https://{s}.basemaps.cartocdn.com/light_all/{z}/{x}/{y}{r}.png',
-            attr='&copy; OpenStreetMap &copy; CARTO',
-            name='Clean Map'
-        ).add_to(m)
-        
-        folium.TileLayer(
-            tiles='https://server.arcgisonline.com/ArcGIS/rest/services/World_Imagery/MapServer/tile/{z}/{y}/{x}',
-            attr='Esri',
-            name='Satellite View'
-        ).add_to(m)
-        
-        folium.LayerControl().add_to(m)
-        
-        # Add drawing tools
-        draw = Draw(
-            draw_options={
-                'polygon': {
-                    'shapeOptions': {
-                        'color': '#059669',
-                        'fillColor': '#059669',
-                        'fillOpacity': 0.3
-                    }
-                },
-                'rectangle': {
-                    'shapeOptions': {
-                        'color': '#059669',
-                        'fillColor': '#059669',
-                        'fillOpacity': 0.3
-                    }
-                },
-                'marker': True,
-                'circlemarker': False,
-                'circle': False,
-                'polyline': False
-            },
-            edit_options={'edit': True, 'remove': True}
-        )
-        draw.add_to(m)
-        
-        # Show existing polygon or marker
-        polygon = st.session_state.get("polygon")
-        if polygon and len(polygon) >= 3:
-            folium.Polygon(
-                locations=[[p[1], p[0]] for p in polygon],  # Convert [lon, lat] to [lat, lon]
-                color='#059669',
-                fill=True,
-                fillColor='#059669',
-                fillOpacity=0.3,
-                popup="Farm Boundary"
-            ).add_to(m)
-        elif "lat" in st.session_state and st.session_state.lat != 20.0:
-            folium.Marker(
-                [st.session_state.lat, st.session_state.lon],
-                popup=f"Selected: {st.session_state.lat:.4f}, {st.session_state.lon:.4f}",
-                icon=folium.DivIcon(
-                    html='''
-                        <div style="background: linear-gradient(135deg, #059669 0%, #047857 100%);
-                            width: 36px; height: 36px; border-radius: 50% 50% 50% 0;
-                            transform: rotate(-45deg); display: flex; align-items: center;
-                            justify-content: center; box-shadow: 0 4px 12px rgba(5, 150, 105, 0.4);
-                            border: 3px solid white;">
-                            <span style="transform: rotate(45deg); font-size: 16px;">🌱</span>
-                        </div>
-                    ''',
-                    icon_size=(36, 36),
-                    icon_anchor=(18, 36)
-                )
-            ).add_to(m)
-        
-        # Render map
-        map_data = st_folium(
-            m, height=450, width=None, key="location_map",
-            returned_objects=["last_clicked", "all_drawings"]
-        )
-        
-        # Handle map interactions
-        if map_data:
-            # Check for drawn polygon
-            if map_data.get("all_drawings"):
-                drawings = map_data["all_drawings"]
-                for drawing in drawings:
-                    if drawing.get("geometry", {}).get("type") == "Polygon":
-                        coords = drawing["geometry"]["coordinates"][0]
-                        st.session_state.polygon = coords
-                        # Set center point
-                        lats = [c[1] for c in coords]
-                        lons = [c[0] for c in coords]
-                        st.session_state.lat = sum(lats) / len(lats)
-                        st.session_state.lon = sum(lons) / len(lons)
-                        st.rerun()
-            
-            # Handle click (if no polygon)
-            elif map_data.get("last_clicked") and not st.session_state.get("polygon"):
-                clicked_lat = map_data["last_clicked"]["lat"]
-                clicked_lon = map_data["last_clicked"]["lng"]
-                if clicked_lat != st.session_state.get("lat") or clicked_lon != st.session_state.get("lon"):
-                    st.session_state.lat = clicked_lat
-                    st.session_state.lon = clicked_lon
-                    st.rerun()
+        _location_map_pane()
     
     with col_controls:
         st.markdown(f"**⚡ {t('quick_select')}:**")
         
-        locations = [
-            ("🇺🇸 Kansas, USA", 37.669, -100.749),
-            ("🇮🇳 Punjab, India", 29.605, 76.273),
-            ("🇧🇷 Goiás, Brazil", -15.826, -47.921),
-            ("🇰🇪 Nairobi, Kenya", -1.286, 36.817),
-        ]
+        st.segmented_control(
+            t('quick_select'),
+            options=list(_PRESET_LOCATIONS),
+            key="preset",
+            on_change=_apply_preset_location,
+            label_visibility="collapsed",
+        )
         
-        for name, lat, lon in locations:
-            if st.button(name, key=f"loc_{name}", use_container_width=True):
-                st.session_state.lat = lat
-                st.session_state.lon = lon
-                st.session_state.polygon = None  # Clear polygon for preset
-                st.rerun()
+        # Typed coordinates are committed together on submit, not one rerun per edit
+        st.session_state.setdefault("coord_lat", float(st.session_state.get("lat", 20.0)))
+        st.session_state.setdefault("coord_lon", float(st.session_state.get("lon", 0.0)))
+        with st.expander("📐 Enter coordinates"):
+            with st.form("coord_form", border=False):
+                st.number_input(
+                    "Latitude", min_value=-90.0, max_value=90.0, format="%.4f", key="coord_lat"
+                )
+                st.number_input(
+                    "Longitude", min_value=-180.0, max_value=180.0, format="%.4f", key="coord_lon"
+                )
+                st.form_submit_button(
+                    "📍 Go to coordinates", use_container_width=True, on_click=_apply_typed_coordinates
+                )
         
         st.markdown("---")
         
@@ -599,9 +808,7 @@ def page_select_location():
                 - Center: {st.session_state.lat:.4f}, {st.session_state.lon:.4f}
             """)
             
-            if st.button("🗑️ Clear Boundary", use_container_width=True):
-                st.session_state.polygon = None
-                st.rerun()
+            st.button("🗑️ Clear Boundary", use_container_width=True, on_click=_clear_boundary)
         elif "lat" in st.session_state and st.session_state.lat != 20.0:
             st.success(f"**📍 Point Selected:** {st.session_state.lat:.4f}, {st.session_state.lon:.4f}")
             st.info("💡 Tip: Draw a polygon for more accurate analysis!")
@@ -612,22 +819,15 @@ def page_select_location():
         
         # Next button
         can_proceed = ("lat" in st.session_state and st.session_state.lat != 20.0)
-        if st.button(f"{t('continue')} →", type="primary", use_container_width=True, disabled=not can_proceed):
-            st.session_state.step = 2
-            st.rerun()
+        st.button(
+            f"{t('continue')} →", type="primary", use_container_width=True, disabled=not can_proceed,
+            on_click=_go_to_step, args=(2,)
+        )
 
 
-def page_loan_details():
-    """Step 2: Loan Details"""
-    render_progress(2)
-    
-    st.markdown(f"""
-        <div class="card">
-            <div class="card-title">💰 {t('loan_purpose_title')}</div>
-            <div class="card-subtitle">{t('loan_purpose_desc')}</div>
-        </div>
-    """, unsafe_allow_html=True)
-    
+@st.fragment
+def _loan_details_form():
+    """Loan amount, purpose and navigation; edits here rerun only this fragment"""
     # Loan amount
     loan_amount = st.slider(
         "Loan Amount (USD)",
@@ -668,7 +868,7 @@ def page_loan_details():
     )
     st.session_state.loan_purpose = purpose
     
-    # Navigation
+    # Navigation changes the step, so it reruns the whole app
     col1, col2 = st.columns(2)
     with col1:
         if st.button(f"← {t('back')}", use_container_width=True):
@@ -680,16 +880,51 @@ def page_loan_details():
             st.rerun()
 
 
+def page_loan_details():
+    """Step 2: Loan Details"""
+    render_progress(2)
+    
+    st.markdown(f"""
+        <div class="card">
+            <div class="card-title">💰 {t('loan_purpose_title')}</div>
+            <div class="card-subtitle">{t('loan_purpose_desc')}</div>
+        </div>
+    """, unsafe_allow_html=True)
+    
+    render_confirm_map(st.session_state.lat, st.session_state.lon, st.session_state.get("polygon"))
+    _loan_details_form()
+
+
+def _analysis_inputs() -> Tuple[Any, ...]:
+    """Everything the analysis result depends on, for detecting an unchanged resubmit."""
+    return (
+        st.session_state.lat,
+        st.session_state.lon,
+        st.session_state.get("polygon"),
+        st.session_state.loan_purpose,
+        st.session_state.get("loan_amount", 500),
+        st.session_state.get("language", "en"),
+    )
+
+
 def page_processing():
     """Step 3: Enhanced Processing with Multi-Temporal Analysis"""
+    # A finished analysis for the same inputs (Back and Analyze again without
+    # edits) is shown as is, rather than re-run and saved a second time
+    inputs = _analysis_inputs()
+    if st.session_state.get("result") and st.session_state.get("result_inputs") == inputs:
+        st.session_state.step = 4
+        st.rerun()
+    
     render_progress(3)
+    backend = load_backend()
     
     st.markdown(f"""
         <div class="card">
-            <div style="text-align: center; padding: 1rem;">
-                <div style="font-size: 3rem;">🔬</div>
-                <div style="font-size: 1.25rem; font-weight: 600; margin: 0.5rem 0;">{t('processing_title')}</div>
-                <div style="color: #6b7280;">Enhanced Multi-Temporal Analysis</div>
+            <div class="processing-header">
+                <div class="processing-icon">🔬</div>
+                <div class="processing-title">{t('processing_title')}</div>
+                <div class="processing-subtitle">Enhanced Multi-Temporal Analysis</div>
             </div>
         </div>
     """, unsafe_allow_html=True)
@@ -704,53 +939,77 @@ def page_processing():
     loan_amount = st.session_state.get("loan_amount", 500)
     
     def update_status(icon, text, progress_val):
-        status_placeholder.markdown(f"""
-            <div style="background: #f0fdf4; border-left: 4px solid #059669; padding: 0.75rem 1rem; border-radius: 0 8px 8px 0; margin: 0.5rem 0;">
-                <span style="margin-right: 0.5rem;">{icon}</span>
-                <span style="color: #065f46;">{text}</span>
-            </div>
-        """, unsafe_allow_html=True)
+        status_placeholder.markdown(
+            _STATUS_LINE_TMPL.format(icon=icon, text=text), unsafe_allow_html=True
+        )
         # Using a custom colored progress bar is hard with st.progress, but the theme will handle it
         progress_bar.progress(progress_val)
-        time.sleep(0.3)
     
     # ========== ANALYSIS STEPS ==========
     
-    # Step 1: Multi-temporal NDVI
-    update_status("🛰️", "Fetching 6 months of satellite imagery...", 0.05)
-    temporal_data = get_multi_temporal_ndvi(lat, lon, months_back=6, polygon=polygon)
-    update_status("📊", f"Analyzed {temporal_data.get('months_analyzed', 0)} months of NDVI data", 0.25)
-    
-    # Step 2: Deforestation check
-    update_status("🌳", "Checking for recent deforestation...", 0.30)
-    deforestation_data = check_deforestation(lat, lon, years_back=2, polygon=polygon)
-    deforest_status = "✅ No deforestation" if not deforestation_data.get("deforestation_detected") else "⚠️ Potential clearing detected"
-    update_status("🌲", deforest_status, 0.45)
-    
-    # Step 3: Weather analysis
-    update_status("🌤️", "Analyzing 90-day climate data...", 0.50)
-    weather_data = weather_service.get_weather_analysis(lat, lon)
-    update_status("☁️", f"Weather risk: {weather_data.get('weather_status', 'Unknown')}", 0.60)
-    
-    # Step 4: Calculate sustainability score
-    update_status("♻️", "Computing sustainability score...", 0.65)
-    sustainability = calculate_sustainability_score(temporal_data, deforestation_data, weather_data)
-    update_status("📈", f"Sustainability: {sustainability.get('overall_score', 0)}/100 (Grade {sustainability.get('grade', 'N/A')})", 0.75)
-    
-    # Step 5: Calculate loan risk
-    update_status("💰", "Calculating loan risk...", 0.80)
-    loan_risk = calculate_loan_risk_score(sustainability, loan_amount, purpose)
-    update_status("🏦", f"Risk Score: {loan_risk.get('risk_score', 0)}/100", 0.85)
-    
-    # Step 6: RAG - Retrieve Regulatory Context
-    update_status("📋", "Retrieving regulatory compliance context (RAG)...", 0.87)
+    # Steps 1-3: NDVI history, deforestation check and weather are independent
+    # network calls, so they run side by side and the wait is the slowest one
+    update_status("🛰️", "Fetching satellite imagery, forest cover and 90-day climate data...", 0.05)
+    site_lat, site_lon = round(lat, 4), round(lon, 4)
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        temporal_future = executor.submit(_cached_ndvi, site_lat, site_lon, polygon)
+        deforestation_future = executor.submit(_cached_deforestation, site_lat, site_lon, polygon)
+        weather_future = executor.submit(_cached_weather, site_lat, site_lon)
+        
+        temporal_data = temporal_future.result()
+        update_status("📊", f"Analyzed {temporal_data.get('months_analyzed', 0)} months of NDVI data", 0.25)
+        
+        deforestation_data = deforestation_future.result()
+        deforest_status = "✅ No deforestation" if not deforestation_data.get("deforestation_detected") else "⚠️ Potential clearing detected"
+        update_status("🌲", deforest_status, 0.45)
+        
+        weather_data = weather_future.result()
+        update_status("☁️", f"Weather risk: {weather_data.get('weather_status', 'Unknown')}", 0.60)
+    
+    # Steps 4-5: Sustainability and loan risk scores. Both are local arithmetic
+    # that finishes instantly, so they share one status update
+    sustainability = backend.calculate_sustainability_score(temporal_data, deforestation_data, weather_data)
+    loan_risk = backend.calculate_loan_risk_score(sustainability, loan_amount, purpose)
+    update_status(
+        "📈",
+        f"Sustainability: {sustainability.get('overall_score', 0)}/100 (Grade {sustainability.get('grade', 'N/A')})"
+        f" · Risk Score: {loan_risk.get('risk_score', 0)}/100",
+        0.85
+    )
+    
     current_lang = st.session_state.get("language", "en")
+    
+    # Step 6: Generate In-Depth Metric Explanations
+    # A separate LLM call that needs only the scores above, so it runs in the
+    # background while the regulatory lookup and loan analysis proceed
+    update_status("📊", "Generating detailed metric explanations...", 0.86)
+    metrics_for_analysis = {
+        "sustainability_score": sustainability.get("overall_score", 50),
+        "sustainability_components": {
+            "vegetation_trend": sustainability.get("component_scores", {}).get("vegetation_trend", 0),
+            "consistency": sustainability.get("component_scores", {}).get("consistency", 0),
+            "no_deforestation": sustainability.get("component_scores", {}).get("no_deforestation", 0),
+            "climate_resilience": sustainability.get("component_scores", {}).get("climate_resilience", 0),
+        },
+        "ndvi_current": temporal_data.get("ndvi_current", 0.5),
+        "ndvi_trend": temporal_data.get("trend_direction", "stable"),
+        "ndvi_consistency": temporal_data.get("consistency_score", 0),
+        "risk_score": loan_risk.get("risk_score", 0),
+        "weather_data": weather_data
+    }
+    explanations_executor = ThreadPoolExecutor(max_workers=1)
+    explanations_future = explanations_executor.submit(
+        backend.generate_metric_explanations, metrics_for_analysis, language=current_lang
+    )
+    
+    # Step 7: RAG - Retrieve Regulatory Context
+    update_status("📋", "Retrieving regulatory compliance context (RAG)...", 0.87)
     regulatory_context_data = None
     try:
-        pinecone_index = get_index()
+        pinecone_index = backend.get_index()
         if pinecone_index:
             sustainability_score = sustainability.get("overall_score", 50)
-            regulatory_context_data = get_compliance_context(
+            regulatory_context_data = backend.get_compliance_context(
                 loan_purpose=purpose or "",
                 sustainability_score=sustainability_score,
                 geographic_region=None,  # Could extract from coordinates
@@ -779,29 +1038,6 @@ def page_processing():
         regulatory_context_data = None
         update_status("⚠️", f"RAG error: {str(e)[:50]}", 0.88)
     
-    # Step 7: Generate In-Depth Metric Explanations
-    update_status("📊", "Generating detailed metric explanations...", 0.89)
-    metric_explanations = None
-    try:
-        metrics_for_analysis = {
-            "sustainability_score": sustainability.get("overall_score", 50),
-            "sustainability_components": {
-                "vegetation_trend": sustainability.get("component_scores", {}).get("vegetation_trend", 0),
-                "consistency": sustainability.get("component_scores", {}).get("consistency", 0),
-                "no_deforestation": sustainability.get("component_scores", {}).get("no_deforestation", 0),
-                "climate_resilience": sustainability.get("component_scores", {}).get("climate_resilience", 0),
-            },
-            "ndvi_current": temporal_data.get("ndvi_current", 0.5),
-            "ndvi_trend": temporal_data.get("trend_direction", "stable"),
-            "ndvi_consistency": temporal_data.get("consistency_score", 0),
-            "risk_score": loan_risk.get("risk_score", 0),
-            "weather_data": weather_data
-        }
-        metric_explanations = generate_metric_explanations(metrics_for_analysis, language=current_lang)
-    except Exception as e:
-        print(f"[Analysis] Error generating explanations: {str(e)}")
-        metric_explanations = None
-    
     # Step 8: AI Analysis with RAG Context
     update_status("🤖", "Generating AI recommendations...", 0.92)
     
@@ -820,12 +1056,17 @@ def page_processing():
     if regulatory_context_data:
         regulatory_context_text = regulatory_context_data.get("formatted_context")
     
+    # Stream the model's draft under the status line while it generates; a
+    # cache hit skips the LLM call, so on_text never fires and the draft
+    # stays empty
+    llm_draft = st.empty()
     try:
-        llm_result = llm_service.analyze_loan_risk(
-            combined_data, 
-            user_request=purpose, 
-            language=current_lang,
-            regulatory_context=regulatory_context_text
+        llm_result = _cached_loan_analysis(
+            combined_data,
+            purpose,
+            current_lang,
+            regulatory_context_text,
+            on_text=llm_draft.caption
         )
     except Exception as e:
         # Fallback to rule-based decision
@@ -845,8 +1086,23 @@ def page_processing():
             "model_used": "rule-based-fallback"
         }
     
+    llm_draft.empty()
+    
+    # Collect the explanations started in step 6
+    update_status("📊", "Finishing detailed metric explanations...", 0.96)
+    try:
+        metric_explanations = explanations_future.result()
+    except Exception as e:
+        print(f"[Analysis] Error generating explanations: {str(e)}")
+        metric_explanations = None
+    finally:
+        explanations_executor.shutdown(wait=False)
+    
     update_status("✅", "Analysis complete!", 1.0)
     
+    # The verification hash is timestamp-based, so it is minted once here with the result
+    tx_hash = backend.generate_blockchain_hash(_certificate_farm_data(temporal_data), llm_result)
+    
     # Store results
     st.session_state.result = {
         "temporal_data": temporal_data,
@@ -856,8 +1112,10 @@ def page_processing():
         "loan_risk": loan_risk,
         "llm_result": llm_result,
         "regulatory_context": regulatory_context_data,
-        "metric_explanations": metric_explanations
+        "metric_explanations": metric_explanations,
+        "tx_hash": tx_hash
     }
+    st.session_state.result_inputs = inputs
     
     # Save to analytics database for banker terminal
     try:
@@ -879,7 +1137,6 @@ def page_processing():
     except Exception as e:
         print(f"[Analytics] Error saving application: {str(e)}")
     
-    time.sleep(0.5)
     st.session_state.step = 4
     st.rerun()
 
@@ -912,8 +1169,8 @@ def page_results():
         <div class="result-hero">
             <div class="result-icon">{icon}</div>
             <div class="result-title {css_class}">{title}</div>
-            <div style="margin-top: 0.5rem;">
-                <span style="background: #f3f4f6; padding: 0.5rem 1rem; border-radius: 20px; font-size: 0.9rem;">
+            <div class="result-badge-row">
+                <span class="result-badge">
                     Confidence: {confidence:.0%} | Risk Score: {loan_risk.get('risk_score', 0)}/100
                 </span>
             </div>
@@ -1048,8 +1305,8 @@ def page_results():
     
     # Certificate
     if "APPROVED" in decision or "CONDITIONAL" in decision:
-        farm_data = {"ndvi_score": temporal_data.get("ndvi_current", 0.5), "status": "Verified"}
-        tx_hash = generate_blockchain_hash(farm_data, llm)
+        farm_data = _certificate_farm_data(temporal_data)
+        tx_hash = result["tx_hash"]
         
         st.markdown(f"""
             <div class="cert-box">
@@ -1059,26 +1316,21 @@ def page_results():
         """, unsafe_allow_html=True)
         
         try:
-            pdf_path, _ = create_green_certificate(farm_data, llm)
-            with open(pdf_path, "rb") as f:
-                st.download_button(
-                    f"📄 {t('download_certificate')}",
-                    data=f,
-                    file_name="GreenChain_Certificate.pdf",
-                    mime="application/pdf",
-                    use_container_width=True
-                )
+            pdf_bytes = _cached_certificate_pdf(tx_hash, farm_data, llm)
+            st.download_button(
+                f"📄 {t('download_certificate')}",
+                data=pdf_bytes,
+                file_name="GreenChain_Certificate.pdf",
+                mime="application/pdf",
+                use_container_width=True
+            )
         except Exception as e:
             st.warning(f"Certificate generation unavailable: {e}")
     
     st.markdown("---")
     
     # Start over
-    if st.button(f"🔄 {t('new_application')}", use_container_width=True):
-        for key in ["step", "lat", "lon", "loan_purpose", "loan_amount", "result", "polygon"]:
-            if key in st.session_state:
-                del st.session_state[key]
-        st.rerun()
+    st.button(f"🔄 {t('new_application')}", use_container_width=True, on_click=_reset_application)
 
 
 # ---------------------------------------------------------------------------
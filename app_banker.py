@@ -13,17 +13,18 @@ import sys
 import time
 import json
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 from datetime import datetime, timedelta
-import random
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 
 import streamlit as st
-import folium
-from folium.plugins import Draw
-from streamlit_folium import st_folium
+import streamlit.components.v1 as components
 from dotenv import load_dotenv
 import plotly.graph_objects as go
 import plotly.express as px
+import pandas as pd
+import numpy as np
 
 # ---------------------------------------------------------------------------
 # Path Setup
@@ -40,6 +41,8 @@ else:
     load_dotenv()
 
 # Service Imports
+from services.cache_utils import UncachedResult
+
 try:
     import services.satellite_service as satellite_service
     import services.weather_service as weather_service
@@ -59,6 +62,208 @@ except ImportError as e:
     SERVICES_AVAILABLE = False
 
 
+# ---------------------------------------------------------------------------
+# Display Constants
+# ---------------------------------------------------------------------------
+_STATUS_COLORS: Dict[str, str] = {
+    "PENDING": "#ffaa00",
+    "APPROVED": "#00ff88",
+    "CONDITIONAL": "#00aaff",
+    "REJECTED": "#ff3344",
+}
+
+# (css class, hex color) per application status
+_STATUS_TUPLES: Dict[str, Tuple[str, str]] = {
+    "PENDING": ("amber", _STATUS_COLORS["PENDING"]),
+    "APPROVED": ("green", _STATUS_COLORS["APPROVED"]),
+    "CONDITIONAL": ("cyan", _STATUS_COLORS["CONDITIONAL"]),
+    "REJECTED": ("red", _STATUS_COLORS["REJECTED"]),
+}
+
+_QUEUE_COLUMNS = ["id", "applicant", "location", "amount", "sustainability_score", "ndvi_trend", "status"]
+
+_QUEUE_COLUMN_CONFIG = {
+    "id": "APPLICATION",
+    "applicant": "APPLICANT",
+    "location": "LOCATION",
+    "amount": st.column_config.NumberColumn("AMOUNT", format="$%d"),
+    "sustainability_score": st.column_config.ProgressColumn("SCORE", min_value=0, max_value=100, format="%d"),
+    "ndvi_trend": "NDVI Δ",
+    "status": "STATUS",
+}
+
+# Static markup shared across reruns
+_TERMINAL_HEADER_TMPL = """
+    <div class="terminal-header">
+        <div class="terminal-title">GREENCHAIN TERMINAL</div>
+        <div class="terminal-meta">
+            <span class="terminal-meta-label">BANKER WORKSTATION</span>
+            <span class="terminal-time">{timestamp} UTC</span>
+            <span class="terminal-connected">● CONNECTED</span>
+        </div>
+    </div>
+"""
+
+_TICKER_TAPE_HTML = """
+    <div class="ticker-tape">
+        <div class="ticker-content">
+            <span class="ticker-item">
+                <span class="ticker-symbol">CARBON</span>
+                <span class="ticker-up">▲ 47.82 +2.3%</span>
+            </span>
+            <span class="ticker-item">
+                <span class="ticker-symbol">ESG.IDX</span>
+                <span class="ticker-up">▲ 1,284.50 +0.8%</span>
+            </span>
+            <span class="ticker-item">
+                <span class="ticker-symbol">GREENBOND</span>
+                <span class="ticker-down">▼ 102.35 -0.2%</span>
+            </span>
+            <span class="ticker-item">
+                <span class="ticker-symbol">NDVI.AVG</span>
+                <span class="ticker-up">▲ 0.642 +0.5%</span>
+            </span>
+            <span class="ticker-item">
+                <span class="ticker-symbol">AGRI.RISK</span>
+                <span class="ticker-down">▼ 23.4 -1.2%</span>
+            </span>
+            <span class="ticker-item">
+                <span class="ticker-symbol">SUSTAIN</span>
+                <span class="ticker-up">▲ 78.9 +0.3%</span>
+            </span>
+            <span class="ticker-item">
+                <span class="ticker-symbol">CARBON</span>
+                <span class="ticker-up">▲ 47.82 +2.3%</span>
+            </span>
+            <span class="ticker-item">
+                <span class="ticker-symbol">ESG.IDX</span>
+                <span class="ticker-up">▲ 1,284.50 +0.8%</span>
+            </span>
+        </div>
+    </div>
+"""
+
+_FUNC_KEYS_HTML = """
+    <div class="func-keys">
+        <span class="func-key">F1 HELP</span>
+        <span class="func-key">F2 QUEUE</span>
+        <span class="func-key">F3 SEARCH</span>
+        <span class="func-key">F4 ANALYZE</span>
+        <span class="func-key">F5 REFRESH</span>
+        <span class="func-key">F6 REPORTS</span>
+        <span class="func-key">F7 EXPORT</span>
+        <span class="func-key">F8 SETTINGS</span>
+    </div>
+"""
+
+_CMD_LINE_OPEN_HTML = """
+    <div class="command-line">
+        <span class="command-prompt">GCH&gt;</span>
+"""
+
+_CMD_LINE_CLOSE_HTML = """
+        <span class="blink" style="color: #ff6600;">_</span>
+    </div>
+"""
+
+_RECO_APPROVE_HTML = """
+    <div class="alert-banner success">
+        <span>✓ RECOMMENDATION: APPROVE</span>
+    </div>
+"""
+
+_RECO_COND_HTML = """
+    <div class="alert-banner warning">
+        <span>⚡ RECOMMENDATION: CONDITIONAL</span>
+    </div>
+    <p style="color: #888; font-size: 0.75rem; margin-top: 0.5rem;">
+    Conditional approval means the application meets some but not all criteria. 
+    Additional documentation or monitoring may be required.
+    </p>
+"""
+
+_RECO_REJECT_HTML = """
+    <div class="alert-banner danger">
+        <span>✗ RECOMMENDATION: REJECT</span>
+    </div>
+"""
+
+_RECO_BY_TIER: Dict[str, str] = {
+    "approve": _RECO_APPROVE_HTML,
+    "cond": _RECO_COND_HTML,
+    "reject": _RECO_REJECT_HTML,
+}
+
+# Parameterised markup, filled with str.format at render time
+_ANALYSIS_BANNER_TMPL = """
+    <div class="alert-banner success">
+        <span class="status-dot green"></span>
+        Analysis Complete | Score: {score}/100 | Grade: {grade}
+    </div>
+"""
+
+
+# Shared Plotly layout for every terminal chart; per-chart settings are
+# passed as keyword overrides to fig.update_layout(_BB_LAYOUT, ...).
+_BB_LAYOUT: Dict[str, Any] = {
+    "template": "plotly_dark",
+    "paper_bgcolor": "#111111",
+    "plot_bgcolor": "#0a0a0a",
+    "font": {"family": "JetBrains Mono, monospace", "color": "#888"},
+}
+
+
+# ---------------------------------------------------------------------------
+# Cached Service Calls
+# ---------------------------------------------------------------------------
+# Callers round coordinates to 4 decimals (~10 m) so nearby lookups share entries.
+# Fallbacks (mock satellite data, weather errors) are raised out rather than
+# stored, so the next lookup retries the service.
+@st.cache_data(ttl=3600, show_spinner=False)
+def _stored_ndvi(lat: float, lon: float, months_back: int) -> Dict[str, Any]:
+    data = get_multi_temporal_ndvi(lat, lon, months_back=months_back)
+    if data.get("is_mock"):
+        raise UncachedResult(data)
+    return data
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _stored_deforestation(lat: float, lon: float) -> Dict[str, Any]:
+    data = check_deforestation(lat, lon)
+    if data.get("is_mock"):
+        raise UncachedResult(data)
+    return data
+
+
+@st.cache_data(ttl=1800, show_spinner=False)
+def _stored_weather(lat: float, lon: float) -> Dict[str, Any]:
+    data = weather_service.get_weather_analysis(lat, lon)
+    if "error" in data:
+        raise UncachedResult(data)
+    return data
+
+
+def _cached_ndvi(lat: float, lon: float, months_back: int) -> Dict[str, Any]:
+    try:
+        return _stored_ndvi(lat, lon, months_back)
+    except UncachedResult as e:
+        return e.data
+
+
+def _cached_deforestation(lat: float, lon: float) -> Dict[str, Any]:
+    try:
+        return _stored_deforestation(lat, lon)
+    except UncachedResult as e:
+        return e.data
+
+
+def _cached_weather(lat: float, lon: float) -> Dict[str, Any]:
+    try:
+        return _stored_weather(lat, lon)
+    except UncachedResult as e:
+        return e.data
+
+
 # ---------------------------------------------------------------------------
 # Bloomberg Terminal Theme
 # ---------------------------------------------------------------------------
@@ -70,448 +275,21 @@ def setup_bloomberg_theme():
         initial_sidebar_state="collapsed"
     )
     
-    st.markdown("""
-        <style>
-        @import url('https://fonts.googleapis.com/css2?family=JetBrains+Mono:wght@300;400;500;600;700&family=Inter:wght@400;500;600;700&display=swap');
-        
-        :root {
-            --bb-black: #000000;
-            --bb-dark: #0a0a0a;
-            --bb-panel: #111111;
-            --bb-border: #2a2a2a;
-            --bb-orange: #ff6600;
-            --bb-amber: #ffaa00;
-            --bb-yellow: #ffcc00;
-            --bb-green: #00ff88;
-            --bb-red: #ff3344;
-            --bb-blue: #00aaff;
-            --bb-cyan: #00ffcc;
-            --bb-white: #ffffff;
-            --bb-gray: #888888;
-            --bb-light-gray: #cccccc;
-        }
-        
-        * { font-family: 'JetBrains Mono', monospace !important; }
-        
-        .stApp {
-            background: var(--bb-black) !important;
-        }
-        
-        .block-container { 
-            padding: 0.5rem 1rem !important; 
-            max-width: 100% !important;
-        }
-        
-        #MainMenu, footer, header { visibility: hidden !important; }
-        div[data-testid="stDecoration"] { display: none !important; }
-        .stDeployButton { display: none !important; }
-        
-        /* Terminal Header */
-        .terminal-header {
-            background: linear-gradient(180deg, #1a1a1a 0%, #0a0a0a 100%);
-            border-bottom: 2px solid var(--bb-orange);
-            padding: 0.5rem 1rem;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin: -0.5rem -1rem 1rem -1rem;
-        }
-        
-        .terminal-title {
-            color: var(--bb-orange);
-            font-size: 1.2rem;
-            font-weight: 700;
-            letter-spacing: 2px;
-        }
-        
-        .terminal-time {
-            color: var(--bb-amber);
-            font-size: 0.9rem;
-        }
-        
-        /* Bloomberg Panel */
-        .bb-panel {
-            background: var(--bb-panel);
-            border: 1px solid var(--bb-border);
-            border-radius: 0;
-            margin: 0.25rem 0;
-            overflow: hidden;
-        }
-        
-        .bb-panel-header {
-            background: linear-gradient(180deg, #222 0%, #111 100%);
-            border-bottom: 1px solid var(--bb-border);
-            padding: 0.4rem 0.75rem;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }
-        
-        .bb-panel-title {
-            color: var(--bb-amber);
-            font-size: 0.75rem;
-            font-weight: 600;
-            letter-spacing: 1px;
-            text-transform: uppercase;
-        }
-        
-        .bb-panel-status {
-            font-size: 0.65rem;
-            padding: 0.15rem 0.4rem;
-            border-radius: 2px;
-        }
-        
-        .bb-panel-status.live {
-            background: var(--bb-green);
-            color: #000;
-        }
-        
-        .bb-panel-status.pending {
-            background: var(--bb-amber);
-            color: #000;
-        }
-        
-        .bb-panel-body {
-            padding: 0.75rem;
-        }
-        
-        /* Data Grid */
-        .data-row {
-            display: flex;
-            justify-content: space-between;
-            padding: 0.3rem 0;
-            border-bottom: 1px solid #1a1a1a;
-        }
-        
-        .data-row:last-child {
-            border-bottom: none;
-        }
-        
-        .data-label {
-            color: var(--bb-gray);
-            font-size: 0.75rem;
-        }
-        
-        .data-value {
-            font-size: 0.8rem;
-            font-weight: 600;
-        }
-        
-        .data-value.positive { color: var(--bb-green); }
-        .data-value.negative { color: var(--bb-red); }
-        .data-value.neutral { color: var(--bb-white); }
-        .data-value.highlight { color: var(--bb-orange); }
-        .data-value.amber { color: var(--bb-amber); }
-        .data-value.cyan { color: var(--bb-cyan); }
-        
-        /* Score Display */
-        .score-display {
-            text-align: center;
-            padding: 1rem;
-        }
-        
-        .score-value-large {
-            font-size: 3rem;
-            font-weight: 700;
-            line-height: 1;
-        }
-        
-        .score-label {
-            color: var(--bb-gray);
-            font-size: 0.7rem;
-            letter-spacing: 1px;
-            text-transform: uppercase;
-            margin-top: 0.5rem;
-        }
-        
-        /* Ticker Tape */
-        .ticker-tape {
-            background: #0a0a0a;
-            border-top: 1px solid var(--bb-border);
-            border-bottom: 1px solid var(--bb-border);
-            padding: 0.4rem 0;
-            overflow: hidden;
-            margin: 0.5rem -1rem;
-        }
-        
-        .ticker-content {
-            display: flex;
-            gap: 2rem;
-            animation: ticker 30s linear infinite;
-            white-space: nowrap;
-        }
-        
-        @keyframes ticker {
-            0% { transform: translateX(0); }
-            100% { transform: translateX(-50%); }
-        }
-        
-        .ticker-item {
-            display: inline-flex;
-            gap: 0.5rem;
-            font-size: 0.75rem;
-        }
-        
-        .ticker-symbol { color: var(--bb-white); font-weight: 600; }
-        .ticker-up { color: var(--bb-green); }
-        .ticker-down { color: var(--bb-red); }
-        
-        /* Application Card */
-        .app-card {
-            background: var(--bb-panel);
-            border: 1px solid var(--bb-border);
-            padding: 0.75rem;
-            margin: 0.5rem 0;
-            cursor: pointer;
-            transition: all 0.2s;
-        }
-        
-        .app-card:hover {
-            border-color: var(--bb-orange);
-            background: #1a1a1a;
-        }
-        
-        .app-card.selected {
-            border-color: var(--bb-orange);
-            border-width: 2px;
-        }
-        
-        .app-id {
-            color: var(--bb-orange);
-            font-size: 0.85rem;
-            font-weight: 600;
-        }
-        
-        .app-meta {
-            color: var(--bb-gray);
-            font-size: 0.7rem;
-            margin-top: 0.25rem;
-        }
-        
-        /* Risk Meter */
-        .risk-meter {
-            display: flex;
-            gap: 2px;
-            margin: 0.5rem 0;
-        }
-        
-        .risk-bar {
-            flex: 1;
-            height: 6px;
-            background: #2a2a2a;
-        }
-        
-        .risk-bar.filled.low { background: var(--bb-green); }
-        .risk-bar.filled.medium { background: var(--bb-amber); }
-        .risk-bar.filled.high { background: var(--bb-red); }
-        
-        /* Command Line */
-        .command-line {
-            background: #050505;
-            border: 1px solid var(--bb-border);
-            padding: 0.5rem 0.75rem;
-            display: flex;
-            align-items: center;
-            gap: 0.5rem;
-            margin-top: 1rem;
-        }
-        
-        .command-prompt {
-            color: var(--bb-orange);
-            font-weight: 700;
-        }
-        
-        .command-input {
-            flex: 1;
-            background: transparent;
-            border: none;
-            color: var(--bb-white);
-            font-family: 'JetBrains Mono', monospace;
-        }
-        
-        /* Function Keys */
-        .func-keys {
-            display: flex;
-            gap: 0.5rem;
-            padding: 0.5rem 0;
-            border-top: 1px solid var(--bb-border);
-            margin-top: 0.5rem;
-        }
-        
-        .func-key {
-            background: #1a1a1a;
-            border: 1px solid var(--bb-border);
-            color: var(--bb-amber);
-            padding: 0.3rem 0.6rem;
-            font-size: 0.65rem;
-            cursor: pointer;
-        }
-        
-        .func-key:hover {
-            background: var(--bb-orange);
-            color: #000;
-        }
-        
-        /* Alert Banner */
-        .alert-banner {
-            padding: 0.4rem 0.75rem;
-            font-size: 0.75rem;
-            display: flex;
-            align-items: center;
-            gap: 0.5rem;
-        }
-        
-        .alert-banner.success {
-            background: rgba(0, 255, 136, 0.1);
-            border-left: 3px solid var(--bb-green);
-            color: var(--bb-green);
-        }
-        
-        .alert-banner.warning {
-            background: rgba(255, 170, 0, 0.1);
-            border-left: 3px solid var(--bb-amber);
-            color: var(--bb-amber);
-        }
-        
-        .alert-banner.danger {
-            background: rgba(255, 51, 68, 0.1);
-            border-left: 3px solid var(--bb-red);
-            color: var(--bb-red);
-        }
-        
-        /* Override Streamlit Elements */
-        .stButton > button {
-            background: #1a1a1a !important;
-            border: 1px solid var(--bb-border) !important;
-            color: var(--bb-amber) !important;
-            border-radius: 0 !important;
-            font-family: 'JetBrains Mono', monospace !important;
-            font-size: 0.75rem !important;
-            text-transform: uppercase !important;
-            letter-spacing: 1px !important;
-            padding: 0.5rem 1rem !important;
-        }
-        
-        .stButton > button:hover {
-            background: var(--bb-orange) !important;
-            color: #000 !important;
-            border-color: var(--bb-orange) !important;
-        }
-        
-        .stButton > button[kind="primary"] {
-            background: var(--bb-orange) !important;
-            color: #000 !important;
-        }
-        
-        .stTextInput > div > div > input {
-            background: #0a0a0a !important;
-            border: 1px solid var(--bb-border) !important;
-            color: var(--bb-white) !important;
-            border-radius: 0 !important;
-        }
-        
-        .stSelectbox > div > div {
-            background: #0a0a0a !important;
-            border: 1px solid var(--bb-border) !important;
-            border-radius: 0 !important;
-        }
-        
-        .stSlider > div > div > div {
-            background: var(--bb-orange) !important;
-        }
-        
-        .stTabs [data-baseweb="tab-list"] {
-            background: #111 !important;
-            gap: 0 !important;
-        }
-        
-        .stTabs [data-baseweb="tab"] {
-            background: #1a1a1a !important;
-            color: var(--bb-gray) !important;
-            border: 1px solid var(--bb-border) !important;
-            border-radius: 0 !important;
-            font-size: 0.75rem !important;
-        }
-        
-        .stTabs [aria-selected="true"] {
-            background: var(--bb-panel) !important;
-            color: var(--bb-orange) !important;
-            border-bottom-color: var(--bb-orange) !important;
-        }
-        
-        .stMetric {
-            background: var(--bb-panel) !important;
-            padding: 0.75rem !important;
-            border: 1px solid var(--bb-border) !important;
-        }
-        
-        .stMetric label {
-            color: var(--bb-gray) !important;
-            font-size: 0.7rem !important;
-        }
-        
-        .stMetric [data-testid="stMetricValue"] {
-            color: var(--bb-amber) !important;
-        }
-        
-        div[data-testid="stAppViewBlockContainer"] {
-            background: var(--bb-black) !important;
-        }
-        
-        /* Map styling */
-        iframe {
-            border: 1px solid var(--bb-border) !important;
-            border-radius: 0 !important;
-        }
-        
-        /* Scrollbar */
-        ::-webkit-scrollbar {
-            width: 8px;
-            height: 8px;
-        }
-        
-        ::-webkit-scrollbar-track {
-            background: #0a0a0a;
-        }
-        
-        ::-webkit-scrollbar-thumb {
-            background: #2a2a2a;
-        }
-        
-        ::-webkit-scrollbar-thumb:hover {
-            background: var(--bb-orange);
-        }
-        
-        /* Blinking cursor effect */
-        .blink {
-            animation: blink 1s step-end infinite;
-        }
-        
-        @keyframes blink {
-            50% { opacity: 0; }
-        }
-        
-        /* Status indicators */
-        .status-dot {
-            width: 8px;
-            height: 8px;
-            border-radius: 50%;
-            display: inline-block;
-            margin-right: 0.5rem;
-        }
-        
-        .status-dot.green { background: var(--bb-green); box-shadow: 0 0 6px var(--bb-green); }
-        .status-dot.amber { background: var(--bb-amber); box-shadow: 0 0 6px var(--bb-amber); }
-        .status-dot.red { background: var(--bb-red); box-shadow: 0 0 6px var(--bb-red); }
-        </style>
-    """, unsafe_allow_html=True)
+    # Served by Streamlit's static file server so the browser caches it across reruns and sessions
+    st.markdown('<link rel="stylesheet" href="app/static/bloomberg.css">', unsafe_allow_html=True)
 
 
 # ---------------------------------------------------------------------------
 # Mock Data for Demo
 # ---------------------------------------------------------------------------
-def generate_mock_applications():
-    """Generate mock loan applications for demo."""
+@st.cache_data(show_spinner=False)
+def generate_mock_applications() -> pd.DataFrame:
+    """
+    Generate mock loan applications for demo (one row per application).
+    
+    Built once per process; st.cache_data hands each session its own copy,
+    so status changes made in one session don't leak into another.
+    """
     applications = [
         {
             "id": "GCH-2026-001847",
@@ -594,10 +372,28 @@ def generate_mock_applications():
             "deforestation": False,
         },
     ]
-    return applications
+    
+    df = pd.DataFrame.from_records(applications)
+    
+    # Parse the display trend once so renderers don't re-parse the string on every rerun
+    df["ndvi_trend_val"] = df["ndvi_trend"].astype(float)
+    df["ndvi_trend_color"] = df["ndvi_trend_val"].ge(0).map({True: "#00ff88", False: "#ff3344"})
+    
+    return df
+
+
+def get_application(applications_df: pd.DataFrame, app_id: str) -> Dict[str, Any]:
+    """Return a single application row as a plain dict."""
+    return applications_df.loc[applications_df["id"] == app_id].to_dict("records")[0]
+
 
+def set_application_status(app_id: str, status: str):
+    """Persist a status change for an application in the session's queue."""
+    df = st.session_state.applications_df
+    df.loc[df["id"] == app_id, "status"] = status
 
-def get_portfolio_stats():
+
+def get_portfolio_stats(applications_df: pd.DataFrame):
     """Calculate portfolio statistics."""
     return {
         "total_applications": 847,
@@ -608,6 +404,8 @@ def get_portfolio_stats():
         "avg_sustainability": 72.4,
         "green_compliance": 94.2,
         "carbon_offset_tons": 1284,
+        # Live counts for the applications currently in the queue
+        "queue_status_counts": applications_df["status"].value_counts().to_dict(),
     }
 
 
@@ -615,153 +413,105 @@ def get_portfolio_stats():
 # Components
 # ---------------------------------------------------------------------------
 
+@contextmanager
+def bb_panel(title: str, status: str = "", status_class: str = "", body_style: str = ""):
+    """Wrap the enclosed Streamlit elements in a Bloomberg-style panel."""
+    status_html = f'<span class="bb-panel-status {status_class}">{status}</span>' if status else ""
+    style_attr = f' style="{body_style}"' if body_style else ""
+    st.markdown(
+        f'<div class="bb-panel"><div class="bb-panel-header">'
+        f'<span class="bb-panel-title">{title}</span>{status_html}</div>'
+        f'<div class="bb-panel-body"{style_attr}>',
+        unsafe_allow_html=True
+    )
+    try:
+        yield
+    finally:
+        # Close the panel even when the body raises (e.g. st.rerun)
+        st.markdown("</div></div>", unsafe_allow_html=True)
+
+
 def render_terminal_header():
     """Render Bloomberg-style terminal header."""
-    now = datetime.now()
-    st.markdown(f"""
-        <div class="terminal-header">
-            <div class="terminal-title">GREENCHAIN TERMINAL</div>
-            <div style="display: flex; gap: 2rem; align-items: center;">
-                <span style="color: #888; font-size: 0.75rem;">BANKER WORKSTATION</span>
-                <span class="terminal-time">{now.strftime("%Y-%m-%d %H:%M:%S")} UTC</span>
-                <span style="color: #00ff88; font-size: 0.75rem;">● CONNECTED</span>
-            </div>
-        </div>
-    """, unsafe_allow_html=True)
+    st.markdown(
+        _TERMINAL_HEADER_TMPL.format(timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
+        unsafe_allow_html=True
+    )
 
 
 def render_ticker_tape():
     """Render market ticker tape."""
-    st.markdown("""
-        <div class="ticker-tape">
-            <div class="ticker-content">
-                <span class="ticker-item">
-                    <span class="ticker-symbol">CARBON</span>
-                    <span class="ticker-up">▲ 47.82 +2.3%</span>
-                </span>
-                <span class="ticker-item">
-                    <span class="ticker-symbol">ESG.IDX</span>
-                    <span class="ticker-up">▲ 1,284.50 +0.8%</span>
-                </span>
-                <span class="ticker-item">
-                    <span class="ticker-symbol">GREENBOND</span>
-                    <span class="ticker-down">▼ 102.35 -0.2%</span>
-                </span>
-                <span class="ticker-item">
-                    <span class="ticker-symbol">NDVI.AVG</span>
-                    <span class="ticker-up">▲ 0.642 +0.5%</span>
-                </span>
-                <span class="ticker-item">
-                    <span class="ticker-symbol">AGRI.RISK</span>
-                    <span class="ticker-down">▼ 23.4 -1.2%</span>
-                </span>
-                <span class="ticker-item">
-                    <span class="ticker-symbol">SUSTAIN</span>
-                    <span class="ticker-up">▲ 78.9 +0.3%</span>
-                </span>
-                <span class="ticker-item">
-                    <span class="ticker-symbol">CARBON</span>
-                    <span class="ticker-up">▲ 47.82 +2.3%</span>
-                </span>
-                <span class="ticker-item">
-                    <span class="ticker-symbol">ESG.IDX</span>
-                    <span class="ticker-up">▲ 1,284.50 +0.8%</span>
-                </span>
-            </div>
-        </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_TICKER_TAPE_HTML, unsafe_allow_html=True)
 
 
 def render_portfolio_panel(stats):
     """Render portfolio overview panel."""
-    st.markdown("""
-        <div class="bb-panel">
-            <div class="bb-panel-header">
-                <span class="bb-panel-title">📊 Portfolio Overview</span>
-                <span class="bb-panel-status live">LIVE</span>
-            </div>
-            <div class="bb-panel-body">
-    """, unsafe_allow_html=True)
-    
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.markdown(f"""
-            <div class="score-display">
-                <div class="score-value-large" style="color: #ffaa00;">{stats['total_applications']}</div>
-                <div class="score-label">Total Applications</div>
-            </div>
-        """, unsafe_allow_html=True)
+    with bb_panel("📊 Portfolio Overview", status="LIVE", status_class="live"):
+        col1, col2, col3, col4 = st.columns(4)
     
-    with col2:
-        st.markdown(f"""
-            <div class="score-display">
-                <div class="score-value-large" style="color: #ff6600;">{stats['pending_review']}</div>
-                <div class="score-label">Pending Review</div>
-            </div>
-        """, unsafe_allow_html=True)
+        with col1:
+            st.markdown(f"""
+                <div class="score-display">
+                    <div class="score-value-large" style="color: #ffaa00;">{stats['total_applications']}</div>
+                    <div class="score-label">Total Applications</div>
+                </div>
+            """, unsafe_allow_html=True)
     
-    with col3:
-        st.markdown(f"""
-            <div class="score-display">
-                <div class="score-value-large" style="color: #00ff88;">${stats['total_disbursed']:,.0f}</div>
-                <div class="score-label">Total Disbursed</div>
-            </div>
-        """, unsafe_allow_html=True)
+        with col2:
+            st.markdown(f"""
+                <div class="score-display">
+                    <div class="score-value-large" style="color: #ff6600;">{stats['pending_review']}</div>
+                    <div class="score-label">Pending Review</div>
+                </div>
+            """, unsafe_allow_html=True)
     
-    with col4:
-        st.markdown(f"""
-            <div class="score-display">
-                <div class="score-value-large" style="color: #00ffcc;">{stats['green_compliance']:.1f}%</div>
-                <div class="score-label">Green Compliance</div>
-            </div>
-        """, unsafe_allow_html=True)
+        with col3:
+            st.markdown(f"""
+                <div class="score-display">
+                    <div class="score-value-large" style="color: #00ff88;">${stats['total_disbursed']:,.0f}</div>
+                    <div class="score-label">Total Disbursed</div>
+                </div>
+            """, unsafe_allow_html=True)
     
-    st.markdown("</div></div>", unsafe_allow_html=True)
+        with col4:
+            st.markdown(f"""
+                <div class="score-display">
+                    <div class="score-value-large" style="color: #00ffcc;">{stats['green_compliance']:.1f}%</div>
+                    <div class="score-label">Green Compliance</div>
+                </div>
+            """, unsafe_allow_html=True)
 
 
-def render_application_queue(applications):
+def render_application_queue(applications_df, stats):
     """Render pending applications queue."""
-    st.markdown("""
-        <div class="bb-panel">
-            <div class="bb-panel-header">
-                <span class="bb-panel-title">📋 Application Queue</span>
-                <span class="bb-panel-status pending">23 PENDING</span>
-            </div>
-            <div class="bb-panel-body" style="padding: 0;">
-    """, unsafe_allow_html=True)
-    
-    for app in applications:
-        status_color = {
-            "PENDING": "#ffaa00",
-            "APPROVED": "#00ff88",
-            "CONDITIONAL": "#00aaff",
-            "REJECTED": "#ff3344"
-        }.get(app["status"], "#888")
-        
-        trend_color = "#00ff88" if app["ndvi_trend"].startswith("+") else "#ff3344"
+    pending = stats["queue_status_counts"].get("PENDING", 0)
+    with bb_panel("📋 Application Queue", status=f"{pending} PENDING", status_class="pending", body_style="padding: 0;"):
+        # One dataframe element for the whole queue instead of a button per application
+        view = applications_df[_QUEUE_COLUMNS]
+        styled = (
+            view.style
+            .map(lambda status: f"color: {_STATUS_COLORS.get(status, '#888')}", subset=["status"])
+            .apply(lambda _: "color: " + applications_df["ndvi_trend_color"], subset=["ndvi_trend"])
+        )
+        event = st.dataframe(
+            styled,
+            key="queue_table",
+            hide_index=True,
+            use_container_width=True,
+            on_select="rerun",
+            selection_mode="single-row",
+            column_config=_QUEUE_COLUMN_CONFIG,
+        )
         
-        if st.button(
-            f"📄 {app['id']} | {app['applicant'][:15]} | ${app['amount']:,} | Score: {app['sustainability_score']}",
-            key=f"app_{app['id']}",
-            use_container_width=True
-        ):
-            st.session_state.selected_application = app
+        if event.selection.rows:
+            app_id = view.iloc[event.selection.rows[0]]["id"]
+            st.session_state.selected_application = get_application(applications_df, app_id)
             st.rerun()
-    
-    st.markdown("</div></div>", unsafe_allow_html=True)
 
 
 def render_application_detail(app):
     """Render detailed application view."""
-    status_colors = {
-        "PENDING": ("amber", "#ffaa00"),
-        "APPROVED": ("green", "#00ff88"),
-        "CONDITIONAL": ("cyan", "#00aaff"),
-        "REJECTED": ("red", "#ff3344")
-    }
-    
-    status_class, status_color = status_colors.get(app["status"], ("amber", "#ffaa00"))
+    status_class, status_color = _STATUS_TUPLES.get(app["status"], _STATUS_TUPLES["PENDING"])
     
     # Header
     st.markdown(f"""
@@ -820,21 +570,21 @@ def render_application_detail(app):
     """, unsafe_allow_html=True)
 
 
+_NDVI_TREND_STEPS = np.array([1.0, 0.8, 0.6, 0.4, 0.2])
+
+
 def render_ndvi_analysis_panel(app):
     """Render NDVI analysis with charts."""
     # Generate mock temporal data
     months = ["Aug", "Sep", "Oct", "Nov", "Dec", "Jan"]
     base_ndvi = app["ndvi_current"]
-    trend_val = float(app["ndvi_trend"])
+    trend_val = app["ndvi_trend_val"]
     
-    ndvi_values = [
-        base_ndvi - trend_val + random.uniform(-0.03, 0.03),
-        base_ndvi - trend_val * 0.8 + random.uniform(-0.03, 0.03),
-        base_ndvi - trend_val * 0.6 + random.uniform(-0.03, 0.03),
-        base_ndvi - trend_val * 0.4 + random.uniform(-0.03, 0.03),
-        base_ndvi - trend_val * 0.2 + random.uniform(-0.03, 0.03),
+    # Earlier months step back along the trend with a little noise; the last is the current reading
+    ndvi_values = np.append(
+        base_ndvi - trend_val * _NDVI_TREND_STEPS + np.random.uniform(-0.03, 0.03, len(_NDVI_TREND_STEPS)),
         base_ndvi
-    ]
+    )
     
     fig = go.Figure()
     
@@ -858,6 +608,7 @@ def render_ndvi_analysis_panel(app):
                   annotation_font_color="#ff3344")
     
     fig.update_layout(
+        _BB_LAYOUT,
         title=dict(text="6-MONTH NDVI TREND", font=dict(color="#ffaa00", size=12)),
         xaxis=dict(
             title="",
@@ -872,22 +623,17 @@ def render_ndvi_analysis_panel(app):
             gridcolor="#2a2a2a",
             linecolor="#2a2a2a"
         ),
-        template="plotly_dark",
-        paper_bgcolor="#111111",
-        plot_bgcolor="#0a0a0a",
         height=300,
         margin=dict(l=40, r=20, t=40, b=30),
-        font=dict(family="JetBrains Mono, monospace", size=10)
+        font=dict(size=10)
     )
     
     st.plotly_chart(fig, use_container_width=True)
 
 
-def render_risk_gauge(app):
-    """Render risk assessment gauge."""
-    risk = app["risk_score"]
-    sustainability = app["sustainability_score"]
-    
+@st.cache_data(max_entries=256, show_spinner=False)
+def _build_risk_gauge(risk: int, sustainability: int) -> go.Figure:
+    """Build the risk/sustainability gauge pair (cached per score combination)."""
     fig = go.Figure()
     
     # Risk gauge
@@ -941,19 +687,28 @@ def render_risk_gauge(app):
     ))
     
     fig.update_layout(
-        paper_bgcolor="#111111",
-        font=dict(family="JetBrains Mono, monospace", color="#888"),
+        _BB_LAYOUT,
         height=200,
         margin=dict(l=20, r=20, t=30, b=10)
     )
     
+    return fig
+
+
+def render_risk_gauge(app):
+    """Render risk assessment gauge."""
+    fig = _build_risk_gauge(app["risk_score"], app["sustainability_score"])
     st.plotly_chart(fig, use_container_width=True)
 
 
-def render_satellite_map(app):
-    """Render satellite map view."""
+@st.cache_data(show_spinner=False)
+def _build_map_html(lat: float, lon: float, app_id: str, ndvi: float) -> str:
+    """Render the application location map to a standalone HTML document."""
+    # Imported here so sessions that never open an application skip folium's import cost
+    import folium
+    
     m = folium.Map(
-        location=[app["lat"], app["lon"]],
+        location=[lat, lon],
         zoom_start=12,
         tiles=None
     )
@@ -962,144 +717,171 @@ def render_satellite_map(app):
     folium.TileLayer(
         tiles='https://{s}.basemaps.cartocdn.com/dark_all/{z}/{x}/{y}{r}.png',
         attr='CartoDB Dark',
-        name='Dark Map'
+        name='Dark Map',
+        subdomains='abcd',
+        max_native_zoom=17,
+        detect_retina=True
     ).add_to(m)
     
     folium.TileLayer(
         tiles='https://server.arcgisonline.com/ArcGIS/rest/services/World_Imagery/MapServer/tile/{z}/{y}/{x}',
         attr='Esri Satellite',
-        name='Satellite'
+        name='Satellite',
+        max_native_zoom=17,
+        detect_retina=True
     ).add_to(m)
     
     # Add marker
     folium.CircleMarker(
-        location=[app["lat"], app["lon"]],
+        location=[lat, lon],
         radius=15,
         color='#ff6600',
         fill=True,
         fillColor='#ff6600',
         fillOpacity=0.3,
-        popup=f"{app['id']}<br>NDVI: {app['ndvi_current']}"
+        popup=f"{app_id}<br>NDVI: {ndvi}"
     ).add_to(m)
     
     folium.LayerControl().add_to(m)
     
-    st_folium(m, height=300, width=None, key="detail_map")
+    return m.get_root().render()
 
 
+def render_satellite_map(app):
+    """Render satellite map view."""
+    # Display-only map: no click capture needed, so skip the st_folium round-trip
+    map_html = _build_map_html(app["lat"], app["lon"], app["id"], app["ndvi_current"])
+    components.html(map_html, height=300)
+
+
+@st.fragment
 def render_decision_panel(app):
-    """Render decision action panel."""
-    st.markdown("""
-        <div class="bb-panel">
-            <div class="bb-panel-header">
-                <span class="bb-panel-title">⚡ Quick Actions</span>
-            </div>
-            <div class="bb-panel-body">
-    """, unsafe_allow_html=True)
-    
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        if st.button("✓ APPROVE", key="approve_btn", type="primary", use_container_width=True):
-            st.session_state.selected_application["status"] = "APPROVED"
-            st.success("Application APPROVED")
+    """Render decision action panel (a fragment: button clicks rerun only this panel)."""
+    with bb_panel("⚡ Quick Actions"):
+        col1, col2, col3, col4 = st.columns(4)
     
-    with col2:
-        if st.button("⚡ CONDITIONAL", key="cond_btn", use_container_width=True):
-            st.session_state.selected_application["status"] = "CONDITIONAL"
-            st.warning("Marked as CONDITIONAL")
+        with col1:
+            if st.button("✓ APPROVE", key="approve_btn", type="primary", use_container_width=True):
+                st.session_state.selected_application["status"] = "APPROVED"
+                set_application_status(app["id"], "APPROVED")
+                st.success("Application APPROVED")
     
-    with col3:
-        if st.button("✗ REJECT", key="reject_btn", use_container_width=True):
-            st.session_state.selected_application["status"] = "REJECTED"
-            st.error("Application REJECTED")
+        with col2:
+            if st.button("⚡ CONDITIONAL", key="cond_btn", use_container_width=True):
+                st.session_state.selected_application["status"] = "CONDITIONAL"
+                set_application_status(app["id"], "CONDITIONAL")
+                st.warning("Marked as CONDITIONAL")
     
-    with col4:
-        if st.button("↻ RE-ANALYZE", key="reanalyze_btn", use_container_width=True):
-            # Clear cached analysis to force re-analysis
-            ai_analysis_key = f"ai_analysis_{app['id']}"
-            if ai_analysis_key in st.session_state:
-                del st.session_state[ai_analysis_key]
-            st.info("Triggering re-analysis with RAG...")
-            st.rerun()
+        with col3:
+            if st.button("✗ REJECT", key="reject_btn", use_container_width=True):
+                st.session_state.selected_application["status"] = "REJECTED"
+                set_application_status(app["id"], "REJECTED")
+                st.error("Application REJECTED")
     
-    st.markdown("</div></div>", unsafe_allow_html=True)
+        with col4:
+            if st.button("↻ RE-ANALYZE", key="reanalyze_btn", use_container_width=True):
+                # Clear cached analysis to force re-analysis
+                ai_analysis_key = f"ai_analysis_{app['id']}"
+                if ai_analysis_key in st.session_state:
+                    del st.session_state[ai_analysis_key]
+                st.info("Triggering re-analysis with RAG...")
+                st.rerun()
 
 
+@st.fragment
 def render_live_analysis_panel():
-    """Render live analysis with real service calls."""
-    st.markdown("""
-        <div class="bb-panel">
-            <div class="bb-panel-header">
-                <span class="bb-panel-title">🛰️ Live Satellite Analysis</span>
-                <span class="bb-panel-status live">REAL-TIME</span>
-            </div>
-            <div class="bb-panel-body">
-    """, unsafe_allow_html=True)
-    
-    col1, col2 = st.columns([1, 2])
+    """Render live analysis with real service calls (a fragment, so editing inputs reruns only this tab)."""
+    with bb_panel("🛰️ Live Satellite Analysis", status="REAL-TIME", status_class="live"):
+        col1, col2 = st.columns([1, 2])
     
-    with col1:
-        st.markdown("**Enter Coordinates:**")
-        lat = st.number_input("Latitude", value=29.605, format="%.4f", key="live_lat")
-        lon = st.number_input("Longitude", value=76.273, format="%.4f", key="live_lon")
-        
-        if st.button("🔍 ANALYZE", key="live_analyze", use_container_width=True, type="primary"):
-            with st.spinner("Fetching satellite data..."):
-                if SERVICES_AVAILABLE:
-                    temporal_data = get_multi_temporal_ndvi(lat, lon, months_back=6)
-                    deforestation = check_deforestation(lat, lon)
-                    weather = weather_service.get_weather_analysis(lat, lon)
-                    sustainability = calculate_sustainability_score(temporal_data, deforestation, weather)
+        with col1:
+            st.markdown("**Enter Coordinates:**")
+            lat = st.number_input("Latitude", value=29.605, format="%.4f", key="live_lat")
+            lon = st.number_input("Longitude", value=76.273, format="%.4f", key="live_lon")
+        
+            if st.button("🔍 ANALYZE", key="live_analyze", use_container_width=True, type="primary"):
+                with st.spinner("Fetching satellite data..."):
+                    if SERVICES_AVAILABLE:
+                        lat, lon = round(lat, 4), round(lon, 4)
+                        # Independent network calls: run them side by side
+                        with ThreadPoolExecutor(max_workers=3) as executor:
+                            ndvi_future = executor.submit(_cached_ndvi, lat, lon, 6)
+                            deforestation_future = executor.submit(_cached_deforestation, lat, lon)
+                            weather_future = executor.submit(_cached_weather, lat, lon)
+                            temporal_data = ndvi_future.result()
+                            deforestation = deforestation_future.result()
+                            weather = weather_future.result()
+                        sustainability = calculate_sustainability_score(temporal_data, deforestation, weather)
                     
-                    st.session_state.live_analysis = {
-                        "temporal": temporal_data,
-                        "deforestation": deforestation,
-                        "weather": weather,
-                        "sustainability": sustainability
-                    }
-                else:
-                    st.error("Services not available")
+                        st.session_state.live_analysis = {
+                            "temporal": temporal_data,
+                            "deforestation": deforestation,
+                            "weather": weather,
+                            "sustainability": sustainability
+                        }
+                    else:
+                        st.error("Services not available")
     
-    with col2:
-        if "live_analysis" in st.session_state:
-            analysis = st.session_state.live_analysis
-            sust = analysis["sustainability"]
+        with col2:
+            if "live_analysis" in st.session_state:
+                analysis = st.session_state.live_analysis
+                sust = analysis["sustainability"]
             
-            st.markdown(f"""
-                <div class="alert-banner success">
-                    <span class="status-dot green"></span>
-                    Analysis Complete | Score: {sust.get('overall_score', 0)}/100 | Grade: {sust.get('grade', 'N/A')}
-                </div>
-            """, unsafe_allow_html=True)
+                st.markdown(
+                    _ANALYSIS_BANNER_TMPL.format(score=sust.get('overall_score', 0), grade=sust.get('grade', 'N/A')),
+                    unsafe_allow_html=True
+                )
             
-            # Display results
-            col_a, col_b, col_c = st.columns(3)
-            with col_a:
-                st.metric("NDVI Current", f"{analysis['temporal'].get('ndvi_current', 0):.3f}")
-            with col_b:
-                st.metric("Trend", analysis['temporal'].get('trend_direction', 'stable').upper())
-            with col_c:
-                deforest = "⚠ YES" if analysis['deforestation'].get('deforestation_detected') else "✓ NO"
-                st.metric("Deforestation", deforest)
+                # Display results
+                col_a, col_b, col_c = st.columns(3)
+                with col_a:
+                    st.metric("NDVI Current", f"{analysis['temporal'].get('ndvi_current', 0):.3f}")
+                with col_b:
+                    st.metric("Trend", analysis['temporal'].get('trend_direction', 'stable').upper())
+                with col_c:
+                    deforest = "⚠ YES" if analysis['deforestation'].get('deforestation_detected') else "✓ NO"
+                    st.metric("Deforestation", deforest)
     
-    st.markdown("</div></div>", unsafe_allow_html=True)
+    if "live_analysis" in st.session_state:
+        analysis = st.session_state.live_analysis
+        temporal = analysis["temporal"]
+        
+        # Show detailed temporal chart
+        if temporal.get("monthly_data"):
+            monthly_df = pd.DataFrame(temporal["monthly_data"], columns=["month", "ndvi"])
+            months = monthly_df["month"].to_numpy()
+            ndvi_vals = monthly_df["ndvi"].to_numpy(dtype=float)
+            
+            # Long histories are reduced to a shape-preserving subset before plotting
+            if len(ndvi_vals) > _MAX_CHART_POINTS:
+                keep = _lttb_indices(ndvi_vals, _MAX_CHART_POINTS)
+                months = months[keep]
+                ndvi_vals = ndvi_vals[keep]
+            
+            fig = go.Figure()
+            fig.add_trace(go.Scatter(
+                x=months, y=ndvi_vals,
+                mode='lines+markers',
+                line=dict(color='#00ff88', width=2),
+                fill='tozeroy',
+                fillcolor='rgba(0, 255, 136, 0.1)'
+            ))
+            
+            fig.add_hline(y=0.5, line_dash="dash", line_color="#ffaa00")
+            fig.add_hline(y=0.3, line_dash="dash", line_color="#ff3344")
+            
+            fig.update_layout(
+                _BB_LAYOUT,
+                title="REAL-TIME NDVI TREND",
+                height=350
+            )
+            
+            st.plotly_chart(fig, use_container_width=True)
 
 
 def render_function_keys():
     """Render Bloomberg-style function keys."""
-    st.markdown("""
-        <div class="func-keys">
-            <span class="func-key">F1 HELP</span>
-            <span class="func-key">F2 QUEUE</span>
-            <span class="func-key">F3 SEARCH</span>
-            <span class="func-key">F4 ANALYZE</span>
-            <span class="func-key">F5 REFRESH</span>
-            <span class="func-key">F6 REPORTS</span>
-            <span class="func-key">F7 EXPORT</span>
-            <span class="func-key">F8 SETTINGS</span>
-        </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_FUNC_KEYS_HTML, unsafe_allow_html=True)
 
 
 def render_analytics_result(result: Dict[str, Any]):
@@ -1108,123 +890,189 @@ def render_analytics_result(result: Dict[str, Any]):
     data = result.get("data", {})
     
     if result_type == "portfolio":
-        st.markdown("""
-            <div class="bb-panel">
-                <div class="bb-panel-header">
-                    <span class="bb-panel-title">📊 Portfolio Statistics</span>
-                </div>
-                <div class="bb-panel-body">
-        """, unsafe_allow_html=True)
-        
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.metric("Total Applications", data.get("total_applications", 0))
-        with col2:
-            st.metric("Approved", data.get("approved", 0))
-        with col3:
-            st.metric("Total Disbursed", f"${data.get('total_disbursed', 0):,.0f}")
-        with col4:
-            st.metric("Avg Sustainability", f"{data.get('avg_sustainability', 0):.1f}")
-        
-        st.markdown("</div></div>", unsafe_allow_html=True)
-    
-    elif result_type == "region":
-        st.markdown("""
-            <div class="bb-panel">
-                <div class="bb-panel-header">
-                    <span class="bb-panel-title">🌍 Regional Analysis</span>
-                </div>
-                <div class="bb-panel-body">
-        """, unsafe_allow_html=True)
-        
-        regions = data.get("regions", {})
-        for region, stats in regions.items():
-            st.markdown(f"**{region}**")
-            col1, col2, col3 = st.columns(3)
+        with bb_panel("📊 Portfolio Statistics"):
+            col1, col2, col3, col4 = st.columns(4)
             with col1:
-                st.metric("Applications", stats.get("count", 0))
+                st.metric("Total Applications", data.get("total_applications", 0))
             with col2:
-                st.metric("Approval Rate", f"{stats.get('approval_rate', 0):.1f}%")
+                st.metric("Approved", data.get("approved", 0))
             with col3:
-                st.metric("Avg Sustainability", f"{stats.get('avg_sustainability', 0):.1f}")
-        
-        st.markdown("</div></div>", unsafe_allow_html=True)
+                st.metric("Total Disbursed", f"${data.get('total_disbursed', 0):,.0f}")
+            with col4:
+                st.metric("Avg Sustainability", f"{data.get('avg_sustainability', 0):.1f}")
+    
+    elif result_type == "region":
+        with bb_panel("🌍 Regional Analysis"):
+            regions = data.get("regions", {})
+            for region, stats in regions.items():
+                st.markdown(f"**{region}**")
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("Applications", stats.get("count", 0))
+                with col2:
+                    st.metric("Approval Rate", f"{stats.get('approval_rate', 0):.1f}%")
+                with col3:
+                    st.metric("Avg Sustainability", f"{stats.get('avg_sustainability', 0):.1f}")
     
     elif result_type == "trend":
-        st.markdown("""
-            <div class="bb-panel">
-                <div class="bb-panel-header">
-                    <span class="bb-panel-title">📈 Trend Analysis</span>
-                </div>
-                <div class="bb-panel-body">
-        """, unsafe_allow_html=True)
-        
-        metric = data.get("metric", "sustainability")
-        trends = data.get("trends", [])
-        periods = data.get("periods", [])
-        
-        if trends and periods:
-            import plotly.graph_objects as go
-            fig = go.Figure()
-            fig.add_trace(go.Scatter(
-                x=periods,
-                y=trends,
-                mode='lines+markers',
-                line=dict(color='#00ff88', width=2),
-                name=metric.title()
-            ))
-            fig.update_layout(
-                title=f"{metric.title()} Trend",
-                template="plotly_dark",
-                paper_bgcolor="#111111",
-                plot_bgcolor="#0a0a0a",
-                height=300,
-                font=dict(family="JetBrains Mono", color="#888")
-            )
-            st.plotly_chart(fig, use_container_width=True)
+        with bb_panel("📈 Trend Analysis"):
+            metric = data.get("metric", "sustainability")
+            trends = data.get("trends", [])
+            periods = data.get("periods", [])
         
-        st.markdown("</div></div>", unsafe_allow_html=True)
+            if trends and periods:
+                import plotly.graph_objects as go
+                fig = go.Figure()
+                fig.add_trace(go.Scatter(
+                    x=periods,
+                    y=trends,
+                    mode='lines+markers',
+                    line=dict(color='#00ff88', width=2),
+                    name=metric.title()
+                ))
+                fig.update_layout(
+                    _BB_LAYOUT,
+                    title=f"{metric.title()} Trend",
+                    height=300
+                )
+                st.plotly_chart(fig, use_container_width=True)
     
     elif result_type == "carbon":
-        st.markdown("""
-            <div class="bb-panel">
-                <div class="bb-panel-header">
-                    <span class="bb-panel-title">🌱 Carbon Impact</span>
-                </div>
-                <div class="bb-panel-body">
-        """, unsafe_allow_html=True)
-        
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("Total Loans", data.get("total_loans", 0))
-        with col2:
-            st.metric("Carbon Offset", f"{data.get('total_carbon_offset_tons', 0):.2f} tons CO2")
-        with col3:
-            st.metric("Equivalent Trees", f"{data.get('equivalent_trees', 0):.0f}")
-        
-        st.markdown("</div></div>", unsafe_allow_html=True)
+        with bb_panel("🌱 Carbon Impact"):
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Total Loans", data.get("total_loans", 0))
+            with col2:
+                st.metric("Carbon Offset", f"{data.get('total_carbon_offset_tons', 0):.2f} tons CO2")
+            with col3:
+                st.metric("Equivalent Trees", f"{data.get('equivalent_trees', 0):.0f}")
     
     elif result_type == "compliance":
-        st.markdown("""
-            <div class="bb-panel">
-                <div class="bb-panel-header">
-                    <span class="bb-panel-title">✅ Compliance Audit</span>
-                </div>
-                <div class="bb-panel-body">
-        """, unsafe_allow_html=True)
-        
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("Total Audited", data.get("total_audited", 0))
-        with col2:
-            st.metric("Compliant", data.get("compliant", 0))
-        with col3:
-            st.metric("Compliance Rate", f"{data.get('compliance_rate', 0):.1f}%")
-        
-        if data.get("issues"):
-            st.warning("Issues found: " + ", ".join(data.get("issues", [])))
+        with bb_panel("✅ Compliance Audit"):
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Total Audited", data.get("total_audited", 0))
+            with col2:
+                st.metric("Compliant", data.get("compliant", 0))
+            with col3:
+                st.metric("Compliance Rate", f"{data.get('compliance_rate', 0):.1f}%")
         
-        st.markdown("</div></div>", unsafe_allow_html=True)
+            if data.get("issues"):
+                st.warning("Issues found: " + ", ".join(data.get("issues", [])))
+
+
+# ---------------------------------------------------------------------------
+# Chart Helpers
+# ---------------------------------------------------------------------------
+_MAX_CHART_POINTS = 500
+
+
+def _lttb_indices(y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Pick ``n_out`` indices of ``y`` using Largest-Triangle-Three-Buckets.
+    
+    Points are treated as evenly spaced on the x axis. The first and last
+    points are always kept; each bucket in between keeps the point forming
+    the largest triangle with the previous pick and the next bucket's mean.
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    
+    x = np.arange(n, dtype=float)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    picked = np.empty(n_out, dtype=int)
+    picked[0], picked[-1] = 0, n - 1
+    
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(area.argmax())
+        picked[i + 1] = a
+    
+    return picked
+
+
+# ---------------------------------------------------------------------------
+# Portfolio Analytics Charts
+# ---------------------------------------------------------------------------
+# This file is the Streamlit entry script, so module-level statements run again
+# on every rerun. The figures are therefore built behind st.cache_resource
+# (once per process) rather than assigned to module constants.
+_PORTFOLIO_STATUS_LABELS = ('Approved', 'Conditional', 'Pending', 'Rejected')
+_PORTFOLIO_STATUS_COUNTS = np.array([523, 124, 23, 177])
+
+_GEO_COUNTRIES = ('India', 'Brazil', 'Kenya', 'USA', 'Nigeria', 'Other')
+_GEO_COUNTS = np.array([234, 187, 156, 124, 89, 57])
+
+_TREND_MONTHS = ('Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan')
+_TREND_APPROVED = np.array([45, 52, 68, 72, 89, 97])
+_TREND_REJECTED = np.array([12, 15, 18, 14, 22, 16])
+
+
+@st.cache_resource(show_spinner=False)
+def _build_portfolio_pie() -> go.Figure:
+    """Status distribution donut (static data, built once per process)."""
+    fig = go.Figure(data=[go.Pie(
+        labels=list(_PORTFOLIO_STATUS_LABELS),
+        values=_PORTFOLIO_STATUS_COUNTS,
+        hole=0.6,
+        marker_colors=['#00ff88', '#00aaff', '#ffaa00', '#ff3344']
+    )])
+    
+    fig.update_layout(
+        _BB_LAYOUT,
+        height=300,
+        showlegend=True,
+        legend=dict(orientation="h", yanchor="bottom", y=-0.2)
+    )
+    return fig
+
+
+@st.cache_resource(show_spinner=False)
+def _build_geo_bar() -> go.Figure:
+    """Applications per country (static data, built once per process)."""
+    fig = go.Figure(data=[go.Bar(
+        x=list(_GEO_COUNTRIES),
+        y=_GEO_COUNTS,
+        marker_color=['#ff6600', '#00ff88', '#00aaff', '#ffaa00', '#00ffcc', '#888']
+    )])
+    
+    fig.update_layout(
+        _BB_LAYOUT,
+        height=300,
+        xaxis=dict(gridcolor="#2a2a2a"),
+        yaxis=dict(gridcolor="#2a2a2a", title="Applications")
+    )
+    return fig
+
+
+@st.cache_resource(show_spinner=False)
+def _build_monthly_trend() -> go.Figure:
+    """Approved vs rejected per month (static data, built once per process)."""
+    months = list(_TREND_MONTHS)
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=months, y=_TREND_APPROVED, name='Approved', 
+                              line=dict(color='#00ff88', width=2), fill='tozeroy',
+                              fillcolor='rgba(0, 255, 136, 0.1)'))
+    fig.add_trace(go.Scatter(x=months, y=_TREND_REJECTED, name='Rejected',
+                              line=dict(color='#ff3344', width=2)))
+    
+    fig.update_layout(
+        _BB_LAYOUT,
+        height=250,
+        xaxis=dict(gridcolor="#2a2a2a"),
+        yaxis=dict(gridcolor="#2a2a2a"),
+        legend=dict(orientation="h", yanchor="bottom", y=1.02)
+    )
+    return fig
 
 
 # ---------------------------------------------------------------------------
@@ -1237,8 +1085,8 @@ def main():
         st.error("⚠ Backend services unavailable. Running in demo mode.")
     
     # Initialize state
-    if "applications" not in st.session_state:
-        st.session_state.applications = generate_mock_applications()
+    if "applications_df" not in st.session_state:
+        st.session_state.applications_df = generate_mock_applications()
     
     if "selected_application" not in st.session_state:
         st.session_state.selected_application = None
@@ -1247,7 +1095,7 @@ def main():
     render_ticker_tape()
     
     # Portfolio stats
-    stats = get_portfolio_stats()
+    stats = get_portfolio_stats(st.session_state.applications_df)
     render_portfolio_panel(stats)
     
     # Main content area
@@ -1260,6 +1108,8 @@ def main():
             # Back button
             if st.button("← BACK TO QUEUE", key="back_btn"):
                 st.session_state.selected_application = None
+                # Drop the table selection so the queue doesn't reopen the same row
+                st.session_state.pop("queue_table", None)
                 st.rerun()
             
             render_application_detail(app)
@@ -1267,347 +1117,187 @@ def main():
             col1, col2 = st.columns([1, 1])
             
             with col1:
-                st.markdown("""
-                    <div class="bb-panel">
-                        <div class="bb-panel-header">
-                            <span class="bb-panel-title">📈 NDVI Analysis</span>
-                        </div>
-                        <div class="bb-panel-body">
-                """, unsafe_allow_html=True)
-                render_ndvi_analysis_panel(app)
-                st.markdown("</div></div>", unsafe_allow_html=True)
+                # Charts and map sit behind tabs so only the active one is laid out by the browser
+                ndvi_tab, risk_tab, map_tab = st.tabs(["📈 NDVI ANALYSIS", "🎯 RISK ASSESSMENT", "🗺️ LOCATION VIEW"])
+                
+                with ndvi_tab:
+                    render_ndvi_analysis_panel(app)
+                
+                with risk_tab:
+                    render_risk_gauge(app)
+                
+                with map_tab:
+                    render_satellite_map(app)
             
             with col2:
-                st.markdown("""
-                    <div class="bb-panel">
-                        <div class="bb-panel-header">
-                            <span class="bb-panel-title">🎯 Risk Assessment</span>
-                        </div>
-                        <div class="bb-panel-body">
-                """, unsafe_allow_html=True)
-                render_risk_gauge(app)
-                st.markdown("</div></div>", unsafe_allow_html=True)
-            
-            col3, col4 = st.columns([1, 1])
-            
-            with col3:
-                st.markdown("""
-                    <div class="bb-panel">
-                        <div class="bb-panel-header">
-                            <span class="bb-panel-title">🗺️ Location View</span>
-                        </div>
-                        <div class="bb-panel-body">
-                """, unsafe_allow_html=True)
-                render_satellite_map(app)
-                st.markdown("</div></div>", unsafe_allow_html=True)
-            
-            with col4:
-                st.markdown("""
-                    <div class="bb-panel">
-                        <div class="bb-panel-header">
-                            <span class="bb-panel-title">📋 AI Recommendation</span>
-                        </div>
-                        <div class="bb-panel-body">
-                """, unsafe_allow_html=True)
-                
-                # Generate AI analysis if not already cached
-                ai_analysis_key = f"ai_analysis_{app['id']}"
-                if ai_analysis_key not in st.session_state:
-                    try:
-                        from services import llm_service
-                        from services.rag_service import get_compliance_context, get_index
-                        from services.analysis_service import generate_metric_explanations
+                with bb_panel("📋 AI Recommendation"):
+                    # Generate AI analysis if not already cached
+                    ai_analysis_key = f"ai_analysis_{app['id']}"
+                    if ai_analysis_key not in st.session_state:
+                        try:
+                            from services import llm_service
+                            from services.rag_service import get_compliance_context, get_index
+                            from services.analysis_service import generate_metric_explanations
                         
-                        # Prepare data for analysis
-                        combined_data = {
-                            "ndvi_score": app.get("ndvi_current", 0.5),
-                            "ndvi_trend": app.get("ndvi_trend", "stable"),
-                            "sustainability_score": app.get("sustainability_score", 50),
-                            "deforestation_risk": "high" if app.get("deforestation", False) else "none",
-                            "weather": {},
-                            "risk_factors": [],
-                            "positive_factors": []
-                        }
+                            # Prepare data for analysis
+                            combined_data = {
+                                "ndvi_score": app.get("ndvi_current", 0.5),
+                                "ndvi_trend": app.get("ndvi_trend", "stable"),
+                                "sustainability_score": app.get("sustainability_score", 50),
+                                "deforestation_risk": "high" if app.get("deforestation", False) else "none",
+                                "weather": {},
+                                "risk_factors": [],
+                                "positive_factors": []
+                            }
                         
-                        # Get RAG context
-                        regulatory_context = None
-                        try:
-                            pinecone_index = get_index()
-                            regulatory_context_data = get_compliance_context(
-                                loan_purpose=app.get("purpose", ""),
-                                sustainability_score=app.get("sustainability_score", 50),
-                                geographic_region=app.get("location", ""),
-                                index=pinecone_index
-                            )
-                            if regulatory_context_data:
-                                regulatory_context = regulatory_context_data.get("formatted_context")
-                        except Exception as e:
-                            print(f"[RAG] Error: {str(e)}")
+                            # Get RAG context
+                            regulatory_context = None
+                            try:
+                                pinecone_index = get_index()
+                                regulatory_context_data = get_compliance_context(
+                                    loan_purpose=app.get("purpose", ""),
+                                    sustainability_score=app.get("sustainability_score", 50),
+                                    geographic_region=app.get("location", ""),
+                                    index=pinecone_index
+                                )
+                                if regulatory_context_data:
+                                    regulatory_context = regulatory_context_data.get("formatted_context")
+                            except Exception as e:
+                                print(f"[RAG] Error: {str(e)}")
                         
-                        # Get AI analysis with RAG
-                        llm_result = llm_service.analyze_loan_risk(
-                            combined_data,
-                            user_request=app.get("purpose", ""),
-                            language="en",
-                            regulatory_context=regulatory_context
-                        )
+                            # Get AI analysis with RAG
+                            llm_result = llm_service.analyze_loan_risk(
+                                combined_data,
+                                user_request=app.get("purpose", ""),
+                                language="en",
+                                regulatory_context=regulatory_context
+                            )
                         
-                        # Get metric explanations
-                        metrics_for_analysis = {
-                            "sustainability_score": app.get("sustainability_score", 50),
-                            "ndvi_current": app.get("ndvi_current", 0.5),
-                            "ndvi_trend": app.get("ndvi_trend", "stable"),
-                            "risk_score": app.get("risk_score", 0),
-                            "weather_data": {}
-                        }
-                        metric_explanations = generate_metric_explanations(metrics_for_analysis)
+                            # Get metric explanations
+                            metrics_for_analysis = {
+                                "sustainability_score": app.get("sustainability_score", 50),
+                                "ndvi_current": app.get("ndvi_current", 0.5),
+                                "ndvi_trend": app.get("ndvi_trend", "stable"),
+                                "risk_score": app.get("risk_score", 0),
+                                "weather_data": {}
+                            }
+                            metric_explanations = generate_metric_explanations(metrics_for_analysis)
                         
-                        st.session_state[ai_analysis_key] = {
-                            "llm_result": llm_result,
-                            "metric_explanations": metric_explanations,
-                            "regulatory_context": regulatory_context_data
-                        }
-                    except Exception as e:
-                        print(f"[AI Analysis] Error: {str(e)}")
-                        # Fallback to simple logic
-                        score = app.get("sustainability_score", 50)
-                        if score >= 70:
-                            decision = "APPROVED"
-                            reasoning = "Strong sustainability indicators."
-                        elif score >= 50:
-                            decision = "CONDITIONAL"
-                            reasoning = "Moderate sustainability score."
-                        else:
-                            decision = "REJECTED"
-                            reasoning = "Low sustainability score."
+                            st.session_state[ai_analysis_key] = {
+                                "llm_result": llm_result,
+                                "metric_explanations": metric_explanations,
+                                "regulatory_context": regulatory_context_data
+                            }
+                        except Exception as e:
+                            print(f"[AI Analysis] Error: {str(e)}")
+                            # Fallback to simple logic
+                            score = app.get("sustainability_score", 50)
+                            if score >= 70:
+                                decision = "APPROVED"
+                                reasoning = "Strong sustainability indicators."
+                            elif score >= 50:
+                                decision = "CONDITIONAL"
+                                reasoning = "Moderate sustainability score."
+                            else:
+                                decision = "REJECTED"
+                                reasoning = "Low sustainability score."
                         
-                        st.session_state[ai_analysis_key] = {
-                            "llm_result": {
-                                "decision": decision,
-                                "reasoning": reasoning,
-                                "confidence": score / 100,
-                                "recommendations": []
-                            },
-                            "metric_explanations": None,
-                            "regulatory_context": None
-                        }
+                            st.session_state[ai_analysis_key] = {
+                                "llm_result": {
+                                    "decision": decision,
+                                    "reasoning": reasoning,
+                                    "confidence": score / 100,
+                                    "recommendations": []
+                                },
+                                "metric_explanations": None,
+                                "regulatory_context": None
+                            }
                 
-                # Display AI analysis
-                ai_data = st.session_state.get(ai_analysis_key, {})
-                llm_result = ai_data.get("llm_result", {})
-                decision = llm_result.get("decision", "PENDING")
-                reasoning = llm_result.get("reasoning", "")
-                confidence = llm_result.get("confidence", 0)
-                recommendations = llm_result.get("recommendations", [])
-                compliance_citations = llm_result.get("compliance_citations", [])
-                regulatory_context_data = ai_data.get("regulatory_context")
+                    # Display AI analysis
+                    ai_data = st.session_state.get(ai_analysis_key, {})
+                    llm_result = ai_data.get("llm_result", {})
+                    decision = llm_result.get("decision", "PENDING")
+                    reasoning = llm_result.get("reasoning", "")
+                    confidence = llm_result.get("confidence", 0)
+                    recommendations = llm_result.get("recommendations", [])
+                    compliance_citations = llm_result.get("compliance_citations", [])
+                    regulatory_context_data = ai_data.get("regulatory_context")
                 
-                # Show RAG status
-                if regulatory_context_data:
-                    rag_status = "✅ RAG Context Retrieved" if regulatory_context_data.get("context") else "⚠️ Limited RAG Context"
-                    st.caption(rag_status)
+                    # Show RAG status
+                    if regulatory_context_data:
+                        rag_status = "✅ RAG Context Retrieved" if regulatory_context_data.get("context") else "⚠️ Limited RAG Context"
+                        st.caption(rag_status)
                 
-                # Update application status based on AI decision (if different)
-                if decision != app.get("status") and decision != "PENDING":
-                    app["status"] = decision
+                    # Update application status based on AI decision (if different)
+                    if decision != app.get("status") and decision != "PENDING":
+                        app["status"] = decision
+                        set_application_status(app["id"], decision)
                 
-                # Decision banner
-                if "APPROVED" in decision:
-                    st.markdown(f"""
-                        <div class="alert-banner success">
-                            <span>✓ RECOMMENDATION: APPROVE</span>
-                        </div>
-                    """, unsafe_allow_html=True)
-                elif "CONDITIONAL" in decision:
-                    st.markdown(f"""
-                        <div class="alert-banner warning">
-                            <span>⚡ RECOMMENDATION: CONDITIONAL</span>
-                        </div>
-                        <p style="color: #888; font-size: 0.75rem; margin-top: 0.5rem;">
-                        Conditional approval means the application meets some but not all criteria. 
-                        Additional documentation or monitoring may be required.
-                        </p>
-                    """, unsafe_allow_html=True)
-                else:
-                    st.markdown(f"""
-                        <div class="alert-banner danger">
-                            <span>✗ RECOMMENDATION: REJECT</span>
-                        </div>
-                    """, unsafe_allow_html=True)
-                
-                # Detailed reasoning
-                st.markdown(f"**Confidence:** {confidence:.0%}")
-                st.markdown(f"**Analysis:**\n\n{reasoning}")
+                    # Decision banner
+                    if "APPROVED" in decision:
+                        tier = "approve"
+                    elif "CONDITIONAL" in decision:
+                        tier = "cond"
+                    else:
+                        tier = "reject"
+                    st.markdown(_RECO_BY_TIER[tier], unsafe_allow_html=True)
                 
-                # Recommendations
-                if recommendations:
-                    st.markdown("**Recommendations:**")
-                    for rec in recommendations:
-                        st.markdown(f"• {rec}")
+                    # Detailed reasoning
+                    st.markdown(f"**Confidence:** {confidence:.0%}")
+                    st.markdown(f"**Analysis:**\n\n{reasoning}")
                 
-                # Compliance citations
-                if compliance_citations:
-                    st.markdown("**Regulatory Compliance:**")
-                    for citation in compliance_citations:
-                        st.markdown(f"• {citation}")
+                    # Recommendations
+                    if recommendations:
+                        st.markdown("**Recommendations:**")
+                        for rec in recommendations:
+                            st.markdown(f"• {rec}")
                 
-                # Metric explanations
-                metric_explanations = ai_data.get("metric_explanations")
-                if metric_explanations:
-                    with st.expander("📊 Detailed Metric Analysis", expanded=False):
-                        if metric_explanations.get("sustainability_explanation"):
-                            st.markdown(f"**Sustainability:** {metric_explanations.get('sustainability_explanation', '')[:200]}...")
-                        if metric_explanations.get("ndvi_explanation"):
-                            st.markdown(f"**NDVI:** {metric_explanations.get('ndvi_explanation', '')[:200]}...")
-                        if metric_explanations.get("actionable_insights"):
-                            st.markdown("**Actionable Insights:**")
-                            for insight in metric_explanations.get("actionable_insights", [])[:3]:
-                                st.markdown(f"• {insight}")
+                    # Compliance citations
+                    if compliance_citations:
+                        st.markdown("**Regulatory Compliance:**")
+                        for citation in compliance_citations:
+                            st.markdown(f"• {citation}")
                 
-                st.markdown("</div></div>", unsafe_allow_html=True)
+                    # Metric explanations
+                    metric_explanations = ai_data.get("metric_explanations")
+                    if metric_explanations:
+                        with st.expander("📊 Detailed Metric Analysis", expanded=False):
+                            if metric_explanations.get("sustainability_explanation"):
+                                st.markdown(f"**Sustainability:** {metric_explanations.get('sustainability_explanation', '')[:200]}...")
+                            if metric_explanations.get("ndvi_explanation"):
+                                st.markdown(f"**NDVI:** {metric_explanations.get('ndvi_explanation', '')[:200]}...")
+                            if metric_explanations.get("actionable_insights"):
+                                st.markdown("**Actionable Insights:**")
+                                for insight in metric_explanations.get("actionable_insights", [])[:3]:
+                                    st.markdown(f"• {insight}")
             
             render_decision_panel(app)
         else:
-            render_application_queue(st.session_state.applications)
+            render_application_queue(st.session_state.applications_df, stats)
     
     with tab2:
         render_live_analysis_panel()
-        
-        if "live_analysis" in st.session_state:
-            analysis = st.session_state.live_analysis
-            temporal = analysis["temporal"]
-            
-            # Show detailed temporal chart
-            if temporal.get("monthly_data"):
-                monthly = temporal["monthly_data"]
-                months = [m["month"] for m in monthly]
-                ndvi_vals = [m["ndvi"] for m in monthly]
-                
-                fig = go.Figure()
-                fig.add_trace(go.Scatter(
-                    x=months, y=ndvi_vals,
-                    mode='lines+markers',
-                    line=dict(color='#00ff88', width=2),
-                    fill='tozeroy',
-                    fillcolor='rgba(0, 255, 136, 0.1)'
-                ))
-                
-                fig.add_hline(y=0.5, line_dash="dash", line_color="#ffaa00")
-                fig.add_hline(y=0.3, line_dash="dash", line_color="#ff3344")
-                
-                fig.update_layout(
-                    title="REAL-TIME NDVI TREND",
-                    template="plotly_dark",
-                    paper_bgcolor="#111111",
-                    plot_bgcolor="#0a0a0a",
-                    height=350,
-                    font=dict(family="JetBrains Mono")
-                )
-                
-                st.plotly_chart(fig, use_container_width=True)
     
     with tab3:
         col1, col2 = st.columns(2)
         
         with col1:
-            st.markdown("""
-                <div class="bb-panel">
-                    <div class="bb-panel-header">
-                        <span class="bb-panel-title">📊 Portfolio Distribution</span>
-                    </div>
-                    <div class="bb-panel-body">
-            """, unsafe_allow_html=True)
-            
-            # Status distribution
-            fig = go.Figure(data=[go.Pie(
-                labels=['Approved', 'Conditional', 'Pending', 'Rejected'],
-                values=[523, 124, 23, 177],
-                hole=0.6,
-                marker_colors=['#00ff88', '#00aaff', '#ffaa00', '#ff3344']
-            )])
-            
-            fig.update_layout(
-                template="plotly_dark",
-                paper_bgcolor="#111111",
-                plot_bgcolor="#0a0a0a",
-                height=300,
-                font=dict(family="JetBrains Mono", color="#888"),
-                showlegend=True,
-                legend=dict(orientation="h", yanchor="bottom", y=-0.2)
-            )
-            
-            st.plotly_chart(fig, use_container_width=True)
-            st.markdown("</div></div>", unsafe_allow_html=True)
+            with bb_panel("📊 Portfolio Distribution"):
+                # Status distribution
+                st.plotly_chart(_build_portfolio_pie(), use_container_width=True)
         
         with col2:
-            st.markdown("""
-                <div class="bb-panel">
-                    <div class="bb-panel-header">
-                        <span class="bb-panel-title">🌍 Geographic Distribution</span>
-                    </div>
-                    <div class="bb-panel-body">
-            """, unsafe_allow_html=True)
-            
-            fig = go.Figure(data=[go.Bar(
-                x=['India', 'Brazil', 'Kenya', 'USA', 'Nigeria', 'Other'],
-                y=[234, 187, 156, 124, 89, 57],
-                marker_color=['#ff6600', '#00ff88', '#00aaff', '#ffaa00', '#00ffcc', '#888']
-            )])
-            
-            fig.update_layout(
-                template="plotly_dark",
-                paper_bgcolor="#111111",
-                plot_bgcolor="#0a0a0a",
-                height=300,
-                font=dict(family="JetBrains Mono", color="#888"),
-                xaxis=dict(gridcolor="#2a2a2a"),
-                yaxis=dict(gridcolor="#2a2a2a", title="Applications")
-            )
-            
-            st.plotly_chart(fig, use_container_width=True)
-            st.markdown("</div></div>", unsafe_allow_html=True)
+            with bb_panel("🌍 Geographic Distribution"):
+                st.plotly_chart(_build_geo_bar(), use_container_width=True)
         
         # Monthly trend
-        st.markdown("""
-            <div class="bb-panel">
-                <div class="bb-panel-header">
-                    <span class="bb-panel-title">📈 Monthly Application Trend</span>
-                </div>
-                <div class="bb-panel-body">
-        """, unsafe_allow_html=True)
-        
-        months = ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan']
-        approved = [45, 52, 68, 72, 89, 97]
-        rejected = [12, 15, 18, 14, 22, 16]
-        
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(x=months, y=approved, name='Approved', 
-                                  line=dict(color='#00ff88', width=2), fill='tozeroy',
-                                  fillcolor='rgba(0, 255, 136, 0.1)'))
-        fig.add_trace(go.Scatter(x=months, y=rejected, name='Rejected',
-                                  line=dict(color='#ff3344', width=2)))
-        
-        fig.update_layout(
-            template="plotly_dark",
-            paper_bgcolor="#111111",
-            plot_bgcolor="#0a0a0a",
-            height=250,
-            font=dict(family="JetBrains Mono", color="#888"),
-            xaxis=dict(gridcolor="#2a2a2a"),
-            yaxis=dict(gridcolor="#2a2a2a"),
-            legend=dict(orientation="h", yanchor="bottom", y=1.02)
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
-        st.markdown("</div></div>", unsafe_allow_html=True)
+        with bb_panel("📈 Monthly Application Trend"):
+            st.plotly_chart(_build_monthly_trend(), use_container_width=True)
     
     render_function_keys()
     
     # Command line interface
-    st.markdown("""
-        <div class="command-line">
-            <span class="command-prompt">GCH&gt;</span>
-    """, unsafe_allow_html=True)
+    st.markdown(_CMD_LINE_OPEN_HTML, unsafe_allow_html=True)
     
     # Command input with autocomplete and Enter key support
     with st.form("command_form", clear_on_submit=False):
@@ -1720,10 +1410,7 @@ def main():
         except Exception as e:
             st.error(f"Command execution error: {str(e)}")
     
-    st.markdown("""
-            <span class="blink" style="color: #ff6600;">_</span>
-        </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_CMD_LINE_CLOSE_HTML, unsafe_allow_html=True)
 
 
 if __name__ == "__main__":
@@ -3,12 +3,28 @@ Credit Agent - Main logic controller for the GreenChain Agent system.
 Orchestrates satellite data fetching and LLM-based loan risk analysis.
 """
 
-from typing import Dict, Any, Optional, Tuple
+import copy
+import functools
+import orjson
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
-from services.satellite_service import get_farm_ndvi
+from concurrent.futures import ThreadPoolExecutor
+from services.satellite_service import get_farm_ndvi, get_farm_ndvi_cached
 from services.llm_service import analyze_loan_risk
 
 
+# The satellite fields analyze_loan_risk reads; volatile ones such as
+# process_time stay out of the memo key
+_DECISION_FIELDS = ("ndvi_score", "status", "cloud_cover", "acquisition_date")
+
+
+@functools.lru_cache(maxsize=256)
+def _analyze_loan_risk_cached(satellite_json: bytes, user_request: Optional[str], day: str) -> Dict[str, Any]:
+    # Keyed on the serialized inputs and the date, so a warm container re-asks
+    # the LLM at least daily; exceptions propagate and are not cached
+    return analyze_loan_risk(orjson.loads(satellite_json), user_request)
+
+
 def process_loan_request(
     latitude: float,
     longitude: float,
@@ -47,7 +63,10 @@ def process_loan_request(
     
     # Step 1: Fetch satellite data and calculate NDVI
     try:
-        satellite_data = get_farm_ndvi(latitude, longitude, date_range)
+        if date_range is None:
+            satellite_data = get_farm_ndvi_cached(latitude, longitude)
+        else:
+            satellite_data = get_farm_ndvi(latitude, longitude, date_range)
     except Exception as e:
         return {
             "error": f"Failed to fetch satellite data: {str(e)}",
@@ -57,7 +76,17 @@ def process_loan_request(
     
     # Step 2: Analyze loan risk using LLM
     try:
-        loan_analysis = analyze_loan_risk(satellite_data, user_request)
+        # The same satellite reading and request on the same day (e.g. a
+        # retried call for the same farm) reuse the previous LLM decision
+        # instead of paying for a new one; callers get a deep copy so they
+        # cannot mutate the memoized decision
+        satellite_json = orjson.dumps(
+            {field: satellite_data[field] for field in _DECISION_FIELDS if field in satellite_data},
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY, default=str
+        )
+        loan_analysis = copy.deepcopy(_analyze_loan_risk_cached(
+            satellite_json, user_request, datetime.now().strftime('%Y-%m-%d')
+        ))
     except Exception as e:
         return {
             "error": f"Failed to analyze loan risk: {str(e)}",
@@ -79,3 +108,41 @@ def process_loan_request(
     
     return response
 
+
+def process_loan_requests_batch(
+    loan_requests: List[Dict[str, Any]],
+    max_workers: int = 8
+) -> List[Dict[str, Any]]:
+    """
+    Process several loan requests concurrently.
+    
+    Each request spends its time waiting on the satellite catalog and the LLM,
+    so up to max_workers run at once; the cap keeps the LLM calls inside the
+    API rate limit. A request that fails (e.g. missing or malformed
+    coordinates) yields an error entry rather than aborting the batch.
+    
+    Args:
+        loan_requests: Dicts with "latitude", "longitude" and optional "date_range"
+            and "user_request", as accepted by process_loan_request
+        max_workers: Maximum number of concurrent requests
+    
+    Returns:
+        One process_loan_request response per request, in input order
+    """
+    def process(request: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            return process_loan_request(
+                float(request["latitude"]),
+                float(request["longitude"]),
+                date_range=request.get("date_range"),
+                user_request=request.get("user_request")
+            )
+        except Exception as e:
+            return {
+                "error": f"{type(e).__name__}: {e}",
+                "farm_location": {"lat": request.get("latitude"), "lon": request.get("longitude")},
+                "timestamp": datetime.utcnow().isoformat()
+            }
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(process, loan_requests))
@@ -11,21 +11,26 @@ to provide comprehensive loan assessments.
 """
 
 import os
-from typing import TypedDict, Annotated, Literal, Dict, Any, Optional
+import logging
+import functools
+from typing import TypedDict, Annotated, Literal, Dict, Any, List, Optional
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import operator
 
+logger = logging.getLogger(__name__)
+
 # Check if langgraph is available
 try:
     from langgraph.graph import StateGraph, END
     LANGGRAPH_AVAILABLE = True
 except ImportError as e:
     LANGGRAPH_AVAILABLE = False
-    print(f"[AGENTS] Warning: LangGraph not installed ({e}). Using fallback mode.")
+    logger.warning("LangGraph not installed (%s). Using fallback mode.", e)
 
 # Import our services
-from services.satellite_service import get_farm_ndvi
-from services.weather_service import get_weather_analysis
+from services.satellite_service import get_farm_ndvi_cached
+from services.weather_service import get_weather_analysis_cached
 from services.llm_service import analyze_loan_risk
 
 
@@ -66,8 +71,18 @@ class AgentState(TypedDict):
 # ---------------------------------------------------------------------------
 # Agent Implementations
 # ---------------------------------------------------------------------------
+# Each agent returns only the fields it produces; LangGraph merges them into
+# the shared state (appending agent_trace via its reducer).
+
+# Risk Analyst composite score weights (sum to 1.0)
+RISK_WEIGHTS = {
+    "vegetation": 0.40,
+    "climate": 0.30,
+    "sustainability": 0.30
+}
+
 
-def field_scout_agent(state: AgentState) -> AgentState:
+def field_scout_agent(state: AgentState) -> Dict[str, Any]:
     """
     🛰️ Field Scout Agent
     
@@ -76,33 +91,36 @@ def field_scout_agent(state: AgentState) -> AgentState:
     - Gather historical weather data
     - Compile initial field report
     """
-    print("\n" + "="*50)
-    print("🛰️ FIELD SCOUT AGENT ACTIVATED")
-    print("="*50)
+    logger.debug("Field Scout agent activated")
     
     lat = state["latitude"]
     lon = state["longitude"]
     errors = []
     
-    # Task 1: Fetch satellite data
-    print(f"[Field Scout] Fetching satellite data for ({lat}, {lon})...")
+    # Satellite and weather lookups are independent network calls, so both
+    # are started at once and the wait is the slower of the two
+    logger.debug("[Field Scout] Fetching satellite data and weather history for (%s, %s)", lat, lon)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        satellite_future = executor.submit(get_farm_ndvi_cached, lat, lon)
+        weather_future = executor.submit(get_weather_analysis_cached, lat, lon)
+    
+    # Task 1: Satellite data
     try:
-        satellite_data = get_farm_ndvi(lat, lon)
-        print(f"[Field Scout] ✓ Satellite data acquired. NDVI: {satellite_data.get('ndvi_score', 'N/A')}")
+        satellite_data = satellite_future.result()
+        logger.debug("[Field Scout] Satellite data acquired. NDVI: %s", satellite_data.get("ndvi_score", "N/A"))
     except Exception as e:
         satellite_data = {"error": str(e), "ndvi_score": 0.0}
         errors.append(f"Satellite error: {str(e)}")
-        print(f"[Field Scout] ✗ Satellite error: {e}")
+        logger.warning("[Field Scout] Satellite error: %s", e)
     
-    # Task 2: Fetch weather data
-    print(f"[Field Scout] Fetching weather history...")
+    # Task 2: Weather data
     try:
-        weather_data = get_weather_analysis(lat, lon)
-        print(f"[Field Scout] ✓ Weather data acquired. Risk: {weather_data.get('weather_risk_score', 'N/A')}")
+        weather_data = weather_future.result()
+        logger.debug("[Field Scout] Weather data acquired. Risk: %s", weather_data.get("weather_risk_score", "N/A"))
     except Exception as e:
         weather_data = {"error": str(e), "weather_risk_score": 0.5}
         errors.append(f"Weather error: {str(e)}")
-        print(f"[Field Scout] ✗ Weather error: {e}")
+        logger.warning("[Field Scout] Weather error: %s", e)
     
     # Compile field report
     field_report = f"""
@@ -124,10 +142,9 @@ Survey Date: {datetime.now().strftime('%Y-%m-%d %H:%M')}
 Field Scout Assessment: {'Data collection successful' if not errors else f'Partial data - {len(errors)} errors'}
 """
     
-    print("[Field Scout] Field report compiled. Handing off to Risk Analyst...")
+    logger.debug("[Field Scout] Field report compiled. Handing off to Risk Analyst")
     
     return {
-        **state,
         "satellite_data": satellite_data,
         "weather_data": weather_data,
         "field_report": field_report,
@@ -136,7 +153,7 @@ Field Scout Assessment: {'Data collection successful' if not errors else f'Parti
     }
 
 
-def risk_analyst_agent(state: AgentState) -> AgentState:
+def risk_analyst_agent(state: AgentState) -> Dict[str, Any]:
     """
     📊 Risk Analyst Agent
     
@@ -145,9 +162,7 @@ def risk_analyst_agent(state: AgentState) -> AgentState:
     - Analyze sustainability metrics
     - Provide risk-based recommendations
     """
-    print("\n" + "="*50)
-    print("📊 RISK ANALYST AGENT ACTIVATED")
-    print("="*50)
+    logger.debug("Risk Analyst agent activated")
     
     satellite_data = state.get("satellite_data", {})
     weather_data = state.get("weather_data", {})
@@ -157,10 +172,10 @@ def risk_analyst_agent(state: AgentState) -> AgentState:
     weather_risk = weather_data.get("weather_risk_score", 0.5)
     drought_risk = weather_data.get("drought_risk_score", 0.5)
     
-    print(f"[Risk Analyst] Analyzing metrics...")
-    print(f"  - NDVI Score: {ndvi_score}")
-    print(f"  - Weather Risk: {weather_risk}")
-    print(f"  - Drought Risk: {drought_risk}")
+    logger.debug(
+        "[Risk Analyst] Analyzing metrics: NDVI %s, weather risk %s, drought risk %s",
+        ndvi_score, weather_risk, drought_risk
+    )
     
     # Calculate component scores (0-1, higher is better)
     vegetation_score = min(1.0, ndvi_score / 0.8) if ndvi_score > 0 else 0
@@ -168,11 +183,7 @@ def risk_analyst_agent(state: AgentState) -> AgentState:
     sustainability_score = 1 - drought_risk
     
     # Weighted composite score
-    weights = {
-        "vegetation": 0.40,
-        "climate": 0.30,
-        "sustainability": 0.30
-    }
+    weights = RISK_WEIGHTS
     
     composite_score = (
         vegetation_score * weights["vegetation"] +
@@ -208,11 +219,12 @@ Risk Factors Identified:
 {f'⚠️ Drought concerns detected' if drought_risk > 0.5 else '✓ Water availability adequate'}
 """
     
-    print(f"[Risk Analyst] Composite Score: {composite_score:.2f} ({risk_scores['risk_level']} risk)")
-    print("[Risk Analyst] Analysis complete. Handing off to Loan Officer...")
+    logger.debug(
+        "[Risk Analyst] Composite score %.2f (%s risk). Handing off to Loan Officer",
+        composite_score, risk_scores["risk_level"]
+    )
     
     return {
-        **state,
         "risk_scores": risk_scores,
         "risk_analysis": risk_analysis,
         "composite_score": composite_score,
@@ -220,7 +232,7 @@ Risk Factors Identified:
     }
 
 
-def loan_officer_agent(state: AgentState) -> AgentState:
+def loan_officer_agent(state: AgentState) -> Dict[str, Any]:
     """
     🏦 Loan Officer Agent
     
@@ -229,9 +241,7 @@ def loan_officer_agent(state: AgentState) -> AgentState:
     - Generate reasoning and recommendations
     - Determine certificate eligibility
     """
-    print("\n" + "="*50)
-    print("🏦 LOAN OFFICER AGENT ACTIVATED")
-    print("="*50)
+    logger.debug("Loan Officer agent activated")
     
     composite_score = state.get("composite_score", 0.0)
     risk_scores = state.get("risk_scores", {})
@@ -239,10 +249,10 @@ def loan_officer_agent(state: AgentState) -> AgentState:
     weather_data = state.get("weather_data", {})
     loan_purpose = state.get("loan_purpose", "")
     
-    print(f"[Loan Officer] Reviewing application...")
-    print(f"  - Composite Score: {composite_score:.2f}")
-    print(f"  - Risk Level: {risk_scores.get('risk_level', 'Unknown')}")
-    print(f"  - Loan Purpose: {loan_purpose[:50]}...")
+    logger.debug(
+        "[Loan Officer] Reviewing application: composite score %.2f, risk level %s, purpose %.50s",
+        composite_score, risk_scores.get("risk_level", "Unknown"), loan_purpose
+    )
     
     # Decision logic
     recommendations = []
@@ -314,11 +324,9 @@ The application may be reconsidered after:
         ]
         certificate_eligible = False
     
-    print(f"[Loan Officer] Decision: {decision} (Confidence: {confidence:.0%})")
-    print("[Loan Officer] Multi-agent workflow complete.")
+    logger.debug("[Loan Officer] Decision: %s (confidence %.0f%%)", decision, confidence * 100)
     
     return {
-        **state,
         "final_decision": decision,
         "confidence": round(confidence, 2),
         "reasoning": reasoning.strip(),
@@ -333,10 +341,14 @@ The application may be reconsidered after:
 # Workflow Construction
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=1)
 def create_agent_workflow():
     """
     Creates the LangGraph workflow connecting all agents.
     
+    The graph has no per-request state, so it is compiled once per process
+    and reused by every analysis.
+    
     Workflow:
     Field Scout → Risk Analyst → Loan Officer → END
     """
@@ -383,9 +395,7 @@ def run_multi_agent_analysis(
     Returns:
         Complete analysis results including all agent outputs
     """
-    print("\n" + "🌱"*25)
-    print("GREENCHAIN MULTI-AGENT SYSTEM INITIATED")
-    print("🌱"*25)
+    logger.debug("Multi-agent analysis started for (%s, %s)", latitude, longitude)
     
     # Initial state
     initial_state: AgentState = {
@@ -417,14 +427,59 @@ def run_multi_agent_analysis(
             return result
     
     # Fallback: Run agents sequentially without LangGraph
-    print("[System] Running in fallback mode (LangGraph not available)")
-    state = field_scout_agent(initial_state)
-    state = risk_analyst_agent(state)
-    state = loan_officer_agent(state)
+    logger.debug("Running agents sequentially (LangGraph not available)")
+    state = initial_state
+    for agent in (field_scout_agent, risk_analyst_agent, loan_officer_agent):
+        update = agent(state)
+        update["agent_trace"] = state["agent_trace"] + update["agent_trace"]
+        state.update(update)
     
     return state
 
 
+def run_batch_analysis(
+    farms: List[Dict[str, Any]],
+    max_workers: int = 8
+) -> List[Dict[str, Any]]:
+    """
+    Run the multi-agent analysis over many farms (portfolio screening).
+    
+    Each analysis is dominated by satellite, weather and LLM requests, so up
+    to max_workers farms are analysed at once; the cap keeps the LLM calls
+    inside the API rate limit.
+    
+    Args:
+        farms: Dicts with "latitude", "longitude" and optional "loan_purpose"
+            and "loan_amount"
+        max_workers: Maximum number of concurrent analyses
+    
+    Returns:
+        One analysis result per farm, in input order. A farm whose analysis
+        fails (e.g. missing coordinates) yields an error entry shaped like
+        process_loan_requests_batch's ("error", "farm_location", UTC
+        "timestamp") rather than aborting the batch.
+    """
+    def analyze(farm: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            return run_multi_agent_analysis(
+                farm["latitude"],
+                farm["longitude"],
+                loan_purpose=farm.get("loan_purpose", ""),
+                loan_amount=farm.get("loan_amount")
+            )
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            logger.warning("Batch analysis failed for farm %s: %s", farm, error)
+            return {
+                "error": error,
+                "farm_location": {"lat": farm.get("latitude"), "lon": farm.get("longitude")},
+                "timestamp": datetime.utcnow().isoformat()
+            }
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(analyze, farms))
+
+
 # For backward compatibility with existing code
 def process_loan_with_agents(lat: float, lon: float, context: str) -> Dict[str, Any]:
     """
@@ -4,87 +4,108 @@ Command Parser for analytics commands in the banker terminal.
 Parses command strings and routes to appropriate analytics functions.
 """
 
-from typing import Dict, Any, Optional, Tuple
-import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, Dict, Any, Mapping, Optional, Tuple
 
 
-def parse_command(command: str) -> Tuple[str, Dict[str, Any]]:
+def _split_first(text: str) -> Tuple[str, str]:
+    """Split off the first whitespace-separated token: "a b c" -> ("a", "b c")."""
+    parts = text.split(None, 1)
+    if not parts:
+        return ("", "")
+    return (parts[0], parts[1] if len(parts) > 1 else "")
+
+
+# Analytics subcommand -> (command type, extractor turning the remaining text into args)
+_ANALYTICS_DISPATCH: Dict[str, Tuple[str, Callable[[str], Dict[str, Any]]]] = {
+    "portfolio": ("analytics_portfolio", lambda rest: {}),
+    "region": ("analytics_region", lambda rest: {"region": " ".join(rest.split()) or None}),
+    "trend": ("analytics_trend", lambda rest: {
+        "metric": _split_first(rest)[0].lower() or "sustainability"
+    }),
+    "carbon": ("analytics_carbon", lambda rest: {}),
+    "compliance": ("analytics_compliance", lambda rest: {}),
+}
+_EXPORT_FORMATS = frozenset({"pdf", "csv"})
+
+
+@lru_cache(maxsize=256)
+def parse_command(command: str) -> Tuple[str, Mapping[str, Any]]:
     """
     Parse a command string and return command type and arguments.
     
+    Results are memoized per command string, so the arguments come back as
+    a read-only mapping shared between calls.
+    
     Args:
         command: Command string (e.g., "/analytics portfolio", "/analytics region India")
     
     Returns:
-        Tuple of (command_type, arguments_dict)
+        Tuple of (command_type, arguments_mapping)
     """
+    command_type, args = _parse_command(command)
+    return (command_type, MappingProxyType(args))
+
+
+def _parse_command(command: str) -> Tuple[str, Dict[str, Any]]:
     command = command.strip()
     
     if not command.startswith("/"):
         return ("invalid", {"error": "Commands must start with /"})
     
-    # Remove leading slash
-    command = command[1:]
-    
-    # Split into parts
-    parts = command.split()
+    # Split off the command name; the rest is handed to the subparser as-is
+    command_type, rest = _split_first(command[1:])
     
-    if not parts:
+    if not command_type:
         return ("help", {})
     
-    command_type = parts[0].lower()
-    args = parts[1:] if len(parts) > 1 else []
+    command_type = command_type.lower()
     
     # Route to appropriate handler
     if command_type == "analytics":
-        return parse_analytics_command(args)
+        return parse_analytics_command(rest)
     elif command_type == "export":
-        return parse_export_command(args)
+        return parse_export_command(rest)
     elif command_type == "help":
         return ("help", {})
     else:
         return ("unknown", {"command": command_type})
 
 
-def parse_analytics_command(args: list) -> Tuple[str, Dict[str, Any]]:
-    """Parse analytics subcommands."""
-    if not args:
+def parse_analytics_command(rest: str) -> Tuple[str, Dict[str, Any]]:
+    """Parse analytics subcommands from the text after "/analytics"."""
+    subcommand, tail = _split_first(rest)
+    
+    if not subcommand:
         return ("analytics_portfolio", {})
     
-    subcommand = args[0].lower()
+    subcommand = subcommand.lower()
     
-    if subcommand == "portfolio":
-        return ("analytics_portfolio", {})
-    elif subcommand == "region":
-        region = " ".join(args[1:]) if len(args) > 1 else None
-        return ("analytics_region", {"region": region})
-    elif subcommand == "trend":
-        metric = args[1].lower() if len(args) > 1 else "sustainability"
-        return ("analytics_trend", {"metric": metric})
-    elif subcommand == "carbon":
-        return ("analytics_carbon", {})
-    elif subcommand == "compliance":
-        return ("analytics_compliance", {})
-    else:
+    entry = _ANALYTICS_DISPATCH.get(subcommand)
+    if entry is None:
         return ("analytics_unknown", {"subcommand": subcommand})
+    
+    command_type, extract_args = entry
+    return (command_type, extract_args(tail))
 
 
-def parse_export_command(args: list) -> Tuple[str, Dict[str, Any]]:
-    """Parse export subcommands."""
-    if not args:
+def parse_export_command(rest: str) -> Tuple[str, Dict[str, Any]]:
+    """Parse export subcommands from the text after "/export"."""
+    format_type = _split_first(rest)[0]
+    
+    if not format_type:
         return ("export_help", {})
     
-    format_type = args[0].lower()
+    format_type = format_type.lower()
     
-    if format_type in ["pdf", "csv"]:
+    if format_type in _EXPORT_FORMATS:
         return (f"export_{format_type}", {})
     else:
         return ("export_unknown", {"format": format_type})
 
 
-def get_help_text() -> str:
-    """Get help text for available commands."""
-    return """
+_HELP_TEXT = """
 Available Commands:
 
 /analytics portfolio          - Show portfolio-wide statistics
@@ -100,44 +121,139 @@ Available Commands:
 """
 
 
-def get_command_suggestions(partial_command: str) -> list:
+def get_help_text() -> str:
+    """Get help text for available commands."""
+    return _HELP_TEXT
+
+
+_TOP_LEVEL_COMMANDS = ["/analytics", "/export", "/help"]
+
+_COMPLETIONS = [
+    "/analytics portfolio",
+    "/analytics region",
+    "/analytics trend",
+    "/analytics carbon",
+    "/analytics compliance",
+    "/export pdf",
+    "/export csv",
+    "/help",
+]
+
+
+def _build_completion_trie(commands: list) -> Dict[str, Any]:
+    """Build a character trie; terminal nodes store the full command under "$"."""
+    root: Dict[str, Any] = {}
+    for command in commands:
+        node = root
+        for char in command:
+            node = node.setdefault(char, {})
+        node["$"] = command
+    return root
+
+
+_COMPLETION_TRIE = _build_completion_trie(_COMPLETIONS)
+
+
+def get_command_suggestions(partial_command: str, limit: int = 5) -> list:
     """Get command suggestions based on partial input."""
-    suggestions = []
-    
-    if not partial_command or partial_command == "/":
-        return [
-            "/analytics",
-            "/export",
-            "/help"
-        ]
+    partial = partial_command.lower().strip() if partial_command else ""
+    if not partial or partial == "/":
+        return list(_TOP_LEVEL_COMMANDS)
     
-    partial = partial_command.lower().strip()
+    # Walk the trie along the typed prefix
+    node = _COMPLETION_TRIE
+    for char in partial:
+        node = node.get(char)
+        if node is None:
+            return []
     
-    if partial.startswith("/analytics"):
-        suggestions = [
-            "/analytics portfolio",
-            "/analytics region",
-            "/analytics trend",
-            "/analytics carbon",
-            "/analytics compliance"
-        ]
-    elif partial.startswith("/export"):
-        suggestions = [
-            "/export pdf",
-            "/export csv"
-        ]
-    elif partial.startswith("/"):
-        suggestions = [
-            "/analytics portfolio",
-            "/export pdf",
-            "/help"
-        ]
-    
-    # Filter suggestions based on partial match
-    if len(partial) > 1:
-        suggestions = [s for s in suggestions if s.lower().startswith(partial.lower())]
+    # Collect up to `limit` completions below the reached node, in insertion order
+    suggestions = []
+    stack = [node]
+    while stack and len(suggestions) < limit:
+        current = stack.pop()
+        if "$" in current:
+            suggestions.append(current["$"])
+        stack.extend(reversed([child for key, child in current.items() if key != "$"]))
     
-    return suggestions[:5]  # Return top 5 suggestions
+    return suggestions
+
+
+def _analytics_result(result_type: str, data: Any) -> Dict[str, Any]:
+    return {"type": result_type, "data": data, "success": True}
+
+
+def _export_result(format_type: str, output_path: str) -> Dict[str, Any]:
+    return {
+        "type": "export",
+        "format": format_type,
+        "path": output_path,
+        "success": True,
+        "message": f"{format_type.upper()} exported to: {output_path}"
+    }
+
+
+def _unknown_command(args: Mapping[str, Any]) -> Dict[str, Any]:
+    command_name = args.get('command', '')
+    suggestions = get_command_suggestions(f"/{command_name}")
+    return {
+        "type": "error",
+        "error": f"Unknown command: '{command_name}'. Available commands: /analytics, /export, /help",
+        "suggestions": suggestions,
+        "success": False
+    }
+
+
+def _unknown_analytics(args: Mapping[str, Any]) -> Dict[str, Any]:
+    subcommand = args.get("subcommand", "")
+    return {
+        "type": "error",
+        "error": f"Unknown analytics subcommand: '{subcommand}'. Available: portfolio, region, trend, carbon, compliance",
+        "success": False
+    }
+
+
+def _unknown_export(args: Mapping[str, Any]) -> Dict[str, Any]:
+    format_type = args.get("format", "")
+    return {
+        "type": "error",
+        "error": f"Unknown export format: '{format_type}'. Available: pdf, csv",
+        "success": False
+    }
+
+
+def _analytics():
+    # Imported on first execution so the parser and autocomplete never load
+    # analytics_service (and pandas); an import failure surfaces as that
+    # command's error response
+    from services import analytics_service
+    return analytics_service
+
+
+# Command type (from parse_command) -> handler taking the parsed arguments
+_HANDLERS: Dict[str, Callable[[Mapping[str, Any]], Dict[str, Any]]] = {
+    "analytics_portfolio": lambda args: _analytics_result(
+        "portfolio", _analytics().get_portfolio_stats()
+    ),
+    "analytics_region": lambda args: _analytics_result(
+        "region", _analytics().get_regional_analysis(args.get("region"))
+    ),
+    "analytics_trend": lambda args: _analytics_result(
+        "trend", _analytics().get_trend_analysis(args.get("metric", "sustainability"))
+    ),
+    "analytics_carbon": lambda args: _analytics_result(
+        "carbon", _analytics().calculate_carbon_impact()
+    ),
+    "analytics_compliance": lambda args: _analytics_result(
+        "compliance", _analytics().get_compliance_audit()
+    ),
+    "export_pdf": lambda args: _export_result("pdf", _analytics().export_to_pdf()),
+    "export_csv": lambda args: _export_result("csv", _analytics().export_to_csv()),
+    "help": lambda args: {"type": "help", "data": get_help_text(), "success": True},
+    "unknown": _unknown_command,
+    "analytics_unknown": _unknown_analytics,
+    "export_unknown": _unknown_export,
+}
 
 
 def execute_command(command: str) -> Dict[str, Any]:
@@ -150,108 +266,18 @@ def execute_command(command: str) -> Dict[str, Any]:
     Returns:
         Dictionary with command results
     """
-    from services import analytics_service
-    
     cmd_type, args = parse_command(command)
     
-    try:
-        if cmd_type == "analytics_portfolio":
-            return {
-                "type": "portfolio",
-                "data": analytics_service.get_portfolio_stats(),
-                "success": True
-            }
-        
-        elif cmd_type == "analytics_region":
-            region = args.get("region")
-            return {
-                "type": "region",
-                "data": analytics_service.get_regional_analysis(region),
-                "success": True
-            }
-        
-        elif cmd_type == "analytics_trend":
-            metric = args.get("metric", "sustainability")
-            return {
-                "type": "trend",
-                "data": analytics_service.get_trend_analysis(metric),
-                "success": True
-            }
-        
-        elif cmd_type == "analytics_carbon":
-            return {
-                "type": "carbon",
-                "data": analytics_service.calculate_carbon_impact(),
-                "success": True
-            }
-        
-        elif cmd_type == "analytics_compliance":
-            return {
-                "type": "compliance",
-                "data": analytics_service.get_compliance_audit(),
-                "success": True
-            }
-        
-        elif cmd_type == "export_pdf":
-            output_path = analytics_service.export_to_pdf()
-            return {
-                "type": "export",
-                "format": "pdf",
-                "path": output_path,
-                "success": True,
-                "message": f"PDF exported to: {output_path}"
-            }
-        
-        elif cmd_type == "export_csv":
-            output_path = analytics_service.export_to_csv()
-            return {
-                "type": "export",
-                "format": "csv",
-                "path": output_path,
-                "success": True,
-                "message": f"CSV exported to: {output_path}"
-            }
-        
-        elif cmd_type == "help":
-            return {
-                "type": "help",
-                "data": get_help_text(),
-                "success": True
-            }
-        
-        elif cmd_type == "unknown":
-            command_name = args.get('command', '')
-            suggestions = get_command_suggestions(f"/{command_name}")
-            return {
-                "type": "error",
-                "error": f"Unknown command: '{command_name}'. Available commands: /analytics, /export, /help",
-                "suggestions": suggestions,
-                "success": False
-            }
-        
-        elif cmd_type == "analytics_unknown":
-            subcommand = args.get("subcommand", "")
-            return {
-                "type": "error",
-                "error": f"Unknown analytics subcommand: '{subcommand}'. Available: portfolio, region, trend, carbon, compliance",
-                "success": False
-            }
-        
-        elif cmd_type == "export_unknown":
-            format_type = args.get("format", "")
-            return {
-                "type": "error",
-                "error": f"Unknown export format: '{format_type}'. Available: pdf, csv",
-                "success": False
-            }
-        
-        else:
-            return {
-                "type": "error",
-                "error": f"Command not recognized: {cmd_type}. Type /help for available commands.",
-                "success": False
-            }
+    handler = _HANDLERS.get(cmd_type)
+    if handler is None:
+        return {
+            "type": "error",
+            "error": f"Command not recognized: {cmd_type}. Type /help for available commands.",
+            "success": False
+        }
     
+    try:
+        return handler(args)
     except Exception as e:
         return {
             "type": "error",
@@ -3,10 +3,24 @@ AWS Lambda entry point for GreenChain Agent.
 Handles incoming requests and orchestrates the loan validation process.
 """
 
-import json
 import os
+import orjson
 from typing import Dict, Any
-from agents.credit_agent import process_loan_request
+
+# CORS headers shared by every response; never mutated
+_HEADERS = {
+    "Content-Type": "application/json",
+    "Access-Control-Allow-Origin": "*",  # In production, restrict this to your domain
+    "Access-Control-Allow-Headers": "Content-Type",
+    "Access-Control-Allow-Methods": "POST, OPTIONS"
+}
+
+# Preflight reply, returned as-is before any body parsing
+_OPTIONS_RESPONSE = {
+    "statusCode": 200,
+    "headers": _HEADERS,
+    "body": ""
+}
 
 
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
@@ -28,28 +42,17 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         "headers": dict
     }
     """
-    # Set CORS headers
-    headers = {
-        "Content-Type": "application/json",
-        "Access-Control-Allow-Origin": "*",  # In production, restrict this to your domain
-        "Access-Control-Allow-Headers": "Content-Type",
-        "Access-Control-Allow-Methods": "POST, OPTIONS"
-    }
-    
     # Handle OPTIONS request for CORS preflight
     if event.get("httpMethod") == "OPTIONS":
-        return {
-            "statusCode": 200,
-            "headers": headers,
-            "body": ""
-        }
+        return _OPTIONS_RESPONSE
     
     try:
         # Parse request body
-        if isinstance(event.get("body"), str):
-            body = json.loads(event["body"])
+        raw_body = event.get("body")
+        if isinstance(raw_body, (str, bytes)):
+            body = orjson.loads(raw_body)
         else:
-            body = event.get("body", {})
+            body = raw_body or {}
         
         # Extract required parameters
         latitude = body.get("latitude")
@@ -58,25 +61,25 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         if latitude is None or longitude is None:
             return {
                 "statusCode": 400,
-                "headers": headers,
-                "body": json.dumps({
+                "headers": _HEADERS,
+                "body": orjson.dumps({
                     "error": "Missing required parameters: latitude and longitude are required"
-                })
+                }).decode()
             }
         
         # Extract optional parameters
         date_range = None
-        if "date_range" in body:
-            date_range_obj = body["date_range"]
-            if isinstance(date_range_obj, dict):
-                start = date_range_obj.get("start")
-                end = date_range_obj.get("end")
-                if start and end:
-                    date_range = (start, end)
+        date_range_obj = body.get("date_range")
+        if isinstance(date_range_obj, dict):
+            start = date_range_obj.get("start")
+            end = date_range_obj.get("end")
+            if start and end:
+                date_range = (start, end)
         
         user_request = body.get("user_request")
         
-        # Process the loan request
+        # Process the loan request (imported here so CORS preflights never load the agent stack)
+        from agents.credit_agent import process_loan_request
         result = process_loan_request(
             latitude=float(latitude),
             longitude=float(longitude),
@@ -92,25 +95,25 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         
         return {
             "statusCode": status_code,
-            "headers": headers,
-            "body": json.dumps(result)
+            "headers": _HEADERS,
+            "body": orjson.dumps(result, option=orjson.OPT_SERIALIZE_NUMPY).decode()
         }
         
     except ValueError as e:
         return {
             "statusCode": 400,
-            "headers": headers,
-            "body": json.dumps({
+            "headers": _HEADERS,
+            "body": orjson.dumps({
                 "error": f"Invalid input: {str(e)}"
-            })
+            }).decode()
         }
     except Exception as e:
         return {
             "statusCode": 500,
-            "headers": headers,
-            "body": json.dumps({
+            "headers": _HEADERS,
+            "body": orjson.dumps({
                 "error": f"Internal server error: {str(e)}"
-            })
+            }).decode()
         }
 
 
@@ -7,6 +7,8 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional, Any
 import numpy as np
 
+from services.http import stac_catalog
+
 # --- HACKATHON SETTINGS ---
 MOCK_MODE = False
 # --------------------------
@@ -19,6 +21,17 @@ try:
 except ImportError:
     SATELLITE_LIBS_AVAILABLE = False
 
+# Sustainability component weights (sum to 1.0)
+SUSTAINABILITY_WEIGHTS = {
+    "trend": 0.30,
+    "consistency": 0.20,
+    "deforestation": 0.25,
+    "climate": 0.25
+}
+
+# Loan purposes containing any of these reduce the risk score
+SUSTAINABLE_PURPOSE_KEYWORDS = ("irrigation", "organic", "solar", "conservation", "drip", "sustainable", "renewable")
+
 
 def get_multi_temporal_ndvi(
     lat: float,
@@ -67,7 +80,7 @@ def get_multi_temporal_ndvi(
         bbox = [lon - 0.005, lat - 0.005, lon + 0.005, lat + 0.005]
     
     try:
-        catalog = pystac_client.Client.open("https://earth-search.aws.element84.com/v1")
+        catalog = stac_catalog()
         
         end_date = datetime.now()
         
@@ -220,7 +233,7 @@ def check_deforestation(
         bbox = [lon - 0.005, lat - 0.005, lon + 0.005, lat + 0.005]
     
     try:
-        catalog = pystac_client.Client.open("https://earth-search.aws.element84.com/v1")
+        catalog = stac_catalog()
         
         end_date = datetime.now()
         
@@ -366,12 +379,7 @@ def calculate_sustainability_score(
     climate_score = int(climate_raw * 100)
     
     # Weighted calculation
-    weights = {
-        "trend": 0.30,
-        "consistency": 0.20,
-        "deforestation": 0.25,
-        "climate": 0.25
-    }
+    weights = SUSTAINABILITY_WEIGHTS
     
     overall_score = (
         trend_score * weights["trend"] +
@@ -430,7 +438,7 @@ def calculate_sustainability_score(
             "deforestation_score": deforestation_score,
             "climate_score": climate_score
         },
-        "weights": weights,
+        "weights": dict(weights),
         "interpretation": interpretation,
         "risk_factors": risk_factors,
         "positive_factors": positive_factors
@@ -475,9 +483,8 @@ def calculate_loan_risk_score(
         amount_risk = 30
     
     # Purpose factor (sustainable purposes reduce risk)
-    sustainable_keywords = ["irrigation", "organic", "solar", "conservation", "drip", "sustainable", "renewable"]
     purpose_lower = purpose.lower()
-    sustainable_purpose = any(kw in purpose_lower for kw in sustainable_keywords)
+    sustainable_purpose = any(kw in purpose_lower for kw in SUSTAINABLE_PURPOSE_KEYWORDS)
     purpose_adjustment = -10 if sustainable_purpose else 0
     
     # Final risk score
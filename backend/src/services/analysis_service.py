@@ -8,9 +8,13 @@ import os
 import requests
 from typing import Dict, Any, Optional
 
+from services.http import shared_session
+
 # --- MOCK MODE ---
 MOCK_MODE = os.getenv("ANALYSIS_MOCK_MODE", "false").lower() == "true"
 
+_session = shared_session()
+
 
 def generate_metric_explanations(
     metrics: Dict[str, Any],
@@ -63,7 +67,7 @@ def generate_metric_explanations(
     }
     
     try:
-        response = requests.post(url, json=payload, headers=headers, timeout=30)
+        response = _session.post(url, json=payload, headers=headers, timeout=30)
         response.raise_for_status()
         
         result = response.json()
@@ -0,0 +1,16 @@
+"""
+Helpers shared by the memoised service lookups.
+"""
+
+from typing import Dict, Any
+
+
+class UncachedResult(Exception):
+    """
+    Raised from inside a memoised function to hand back a result without
+    caching it, e.g. the fallback from a failed API call, so the next call
+    retries. Callers catch it and return `.data`.
+    """
+    def __init__(self, data: Dict[str, Any]):
+        super().__init__(data.get("error"))
+        self.data = data
@@ -0,0 +1,25 @@
+"""
+Shared network clients for the services.
+
+Every service makes its requests through these, so repeated calls reuse one
+pooled HTTPS connection per host and the STAC catalog root is fetched once.
+"""
+
+import functools
+import requests
+
+STAC_CATALOG_URL = "https://earth-search.aws.element84.com/v1"
+
+
+@functools.lru_cache(maxsize=1)
+def shared_session() -> requests.Session:
+    """The process-wide requests session used for Gemini, Open-Meteo and embedding calls."""
+    return requests.Session()
+
+
+@functools.lru_cache(maxsize=1)
+def stac_catalog() -> "pystac_client.Client":
+    """Element84 STAC catalog, opened once (opening fetches the catalog root)."""
+    # Imported here because pystac_client is optional for some callers
+    import pystac_client
+    return pystac_client.Client.open(STAC_CATALOG_URL)
@@ -3,14 +3,19 @@ LLM Service for analyzing loan risk using Google Gemini API.
 """
 
 import os
+import orjson
 import requests
 import random
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional
+
+from services.http import shared_session
 
 # --- MOCK MODE ---
 # Set to True to skip API calls and return mock responses (for testing)
 MOCK_MODE = False
 
+_session = shared_session()
+
 
 # Language names for prompts
 LANGUAGE_NAMES = {
@@ -29,7 +34,8 @@ def analyze_loan_risk(
     farm_data: Dict[str, Any],
     user_request: Optional[str] = None,
     language: str = "en",
-    regulatory_context: Optional[str] = None
+    regulatory_context: Optional[str] = None,
+    on_text: Optional[Callable[[str], None]] = None
 ) -> Dict[str, Any]:
     """
     Analyze loan risk based on farm NDVI data using Google Gemini API.
@@ -39,6 +45,8 @@ def analyze_loan_risk(
         user_request: Optional user-provided context or request details
         language: Language code for response (en, es, hi, pt, fr, sw, zh, ar)
         regulatory_context: Optional formatted regulatory context from RAG service
+        on_text: Optional callback; when given, the response is streamed and the
+            callback receives the text generated so far after each chunk
 
     Returns:
         Dictionary containing loan decision and analysis:
@@ -156,7 +164,10 @@ RECOMMENDATIONS: [List any recommendations, or "None" if approved{f' - respond i
 {f'COMPLIANCE: [Reference specific regulations from the provided context that support your decision]' if regulatory_context else ''}"""
 
     # Make request to Gemini API (using gemini-2.0-flash)
-    url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent?key={api_key}"
+    if on_text:
+        url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:streamGenerateContent?alt=sse&key={api_key}"
+    else:
+        url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent?key={api_key}"
 
     headers = {
         "Content-Type": "application/json"
@@ -175,16 +186,19 @@ RECOMMENDATIONS: [List any recommendations, or "None" if approved{f' - respond i
     }
 
     try:
-        response = requests.post(url, json=payload, headers=headers, timeout=30)
-        response.raise_for_status()
+        if on_text:
+            assistant_message = _stream_text(url, payload, headers, on_text)
+        else:
+            response = _session.post(url, json=payload, headers=headers, timeout=30)
+            response.raise_for_status()
 
-        result = response.json()
+            result = response.json()
 
-        # Extract the generated text from Gemini response
-        if "candidates" in result and len(result["candidates"]) > 0:
-            assistant_message = result["candidates"][0]["content"]["parts"][0]["text"]
-        else:
-            raise RuntimeError("No content generated by Gemini API")
+            # Extract the generated text from Gemini response
+            if "candidates" in result and len(result["candidates"]) > 0:
+                assistant_message = result["candidates"][0]["content"]["parts"][0]["text"]
+            else:
+                raise RuntimeError("No content generated by Gemini API")
 
         # Parse the response to extract decision, confidence, reasoning, recommendations, and compliance
         lines = assistant_message.strip().split('\n')
@@ -241,3 +255,29 @@ RECOMMENDATIONS: [List any recommendations, or "None" if approved{f' - respond i
     except (KeyError, IndexError) as e:
         raise RuntimeError(f"Unexpected response format from Gemini API: {str(e)}")
 
+
+def _stream_text(
+    url: str,
+    payload: Dict[str, Any],
+    headers: Dict[str, str],
+    on_text: Callable[[str], None]
+) -> str:
+    """POST to a Gemini streamGenerateContent (SSE) endpoint and return the full text."""
+    text = ""
+    with _session.post(url, json=payload, headers=headers, timeout=30, stream=True) as response:
+        response.raise_for_status()
+        # SSE is always UTF-8, but requests falls back to ISO-8859-1 when the
+        # Content-Type has no charset, so lines are read as bytes and orjson
+        # decodes them
+        for line in response.iter_lines():
+            if not line or not line.startswith(b"data:"):
+                continue
+            chunk = orjson.loads(line[len(b"data:"):])
+            for candidate in chunk.get("candidates", [])[:1]:
+                for part in candidate.get("content", {}).get("parts", []):
+                    text += part.get("text", "")
+            on_text(text)
+    
+    if not text:
+        raise RuntimeError("No content generated by Gemini API")
+    return text
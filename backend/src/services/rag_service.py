@@ -11,6 +11,8 @@ from typing import Dict, Any, List, Optional
 from pathlib import Path
 import requests
 
+from services.http import shared_session
+
 # Try to import Pinecone
 try:
     from pinecone import Pinecone, ServerlessSpec
@@ -30,6 +32,8 @@ except ImportError:
 # --- MOCK MODE ---
 MOCK_MODE = os.getenv("RAG_MOCK_MODE", "false").lower() == "true"
 
+_session = shared_session()
+
 
 def get_gemini_embedding(text: str, api_key: Optional[str] = None) -> List[float]:
     """
@@ -65,7 +69,7 @@ def get_gemini_embedding(text: str, api_key: Optional[str] = None) -> List[float
     }
     
     try:
-        response = requests.post(url, json=payload, headers=headers, timeout=30)
+        response = _session.post(url, json=payload, headers=headers, timeout=30)
         response.raise_for_status()
         result = response.json()
         
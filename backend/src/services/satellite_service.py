@@ -4,6 +4,7 @@ INCLUDES: Mock Mode for fast testing & Error Handling for 'NaN' values.
 """
 import time
 import os
+import functools
 from datetime import datetime, timedelta
 from typing import Dict, Tuple, Optional, Any
 import pystac_client
@@ -11,6 +12,9 @@ import stackstac
 import xarray as xr
 import numpy as np
 
+from services.cache_utils import UncachedResult
+from services.http import stac_catalog
+
 # --- HACKATHON SETTINGS ---
 # Set to True to skip downloading and return fake data (for testing Agent logic)
 # Set to False when you want to record your demo video with real data.
@@ -50,7 +54,7 @@ def get_farm_ndvi(
 
     try:
         # Connect to Element84 Catalog
-        catalog = pystac_client.Client.open("https://earth-search.aws.element84.com/v1")
+        catalog = stac_catalog()
         
         # Reduced Bounding Box (Only 200m radius) for speed
         bbox = [lon - 0.002, lat - 0.002, lon + 0.002, lat + 0.002]
@@ -126,6 +130,26 @@ def get_farm_ndvi(
         print(f"[SATELLITE] ERROR: {str(e)}")
         return _get_fallback_data(str(e))
 
+@functools.lru_cache(maxsize=1024)
+def _ndvi_for_cell(lat: float, lon: float, day: str) -> Dict[str, Any]:
+    data = get_farm_ndvi(lat, lon)
+    if "error" in data:
+        raise UncachedResult(data)
+    return data
+
+
+def get_farm_ndvi_cached(lat: float, lon: float) -> Dict[str, Any]:
+    """
+    get_farm_ndvi() over the default 60-day window, memoised per ~10 m cell
+    (coordinates rounded to 4 decimals) and per day. Fallback results from a
+    failed lookup are returned but not cached, so the next call retries.
+    """
+    try:
+        return dict(_ndvi_for_cell(round(lat, 4), round(lon, 4), datetime.now().strftime('%Y-%m-%d')))
+    except UncachedResult as e:
+        return e.data
+
+
 def _get_fallback_data(reason: str):
     """Returns safe dummy data so the Agent doesn't crash during a demo."""
     return {
@@ -3,14 +3,20 @@ Weather Service for fetching historical weather and climate data.
 Uses Open-Meteo API (free, no API key required) for weather analysis.
 """
 
+import functools
 import requests
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, Tuple
 import statistics
 
+from services.cache_utils import UncachedResult
+from services.http import shared_session
+
 # --- MOCK MODE ---
 MOCK_MODE = False
 
+_session = shared_session()
+
 
 def get_weather_analysis(
     lat: float,
@@ -71,7 +77,7 @@ def get_weather_analysis(
         }
         
         print("[WEATHER] 2. Calling Open-Meteo API...")
-        response = requests.get(url, params=params, timeout=30)
+        response = _session.get(url, params=params, timeout=30)
         response.raise_for_status()
         data = response.json()
         
@@ -231,6 +237,26 @@ def _get_mock_weather_data() -> Dict[str, Any]:
     }
 
 
+@functools.lru_cache(maxsize=1024)
+def _weather_for_cell(lat: float, lon: float, hour: str) -> Dict[str, Any]:
+    data = get_weather_analysis(lat, lon)
+    if "error" in data:
+        raise UncachedResult(data)
+    return data
+
+
+def get_weather_analysis_cached(lat: float, lon: float) -> Dict[str, Any]:
+    """
+    get_weather_analysis() over the default 90 days, memoised per ~10 m cell
+    (coordinates rounded to 4 decimals) and per hour. Fallback results from a
+    failed request are returned but not cached, so the next call retries.
+    """
+    try:
+        return dict(_weather_for_cell(round(lat, 4), round(lon, 4), datetime.now().strftime('%Y-%m-%d %H')))
+    except UncachedResult as e:
+        return e.data
+
+
 def _get_fallback_weather_data(reason: str) -> Dict[str, Any]:
     """Returns fallback data when API fails."""
     return {
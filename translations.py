@@ -945,13 +945,21 @@ TRANSLATIONS = {
 }
 
 
+# Per-language tables with the English fallback already merged in, so a
+# lookup is a single dict access
+_BUNDLES = {
+    lang: {**TRANSLATIONS["en"], **strings}
+    for lang, strings in TRANSLATIONS.items()
+}
+
+
 def get_text(key: str, lang: str = "en") -> str:
     """Get translated text for a key."""
-    return TRANSLATIONS.get(lang, TRANSLATIONS["en"]).get(key, TRANSLATIONS["en"].get(key, key))
+    return _BUNDLES.get(lang, _BUNDLES["en"]).get(key, key)
 
 
 def t(key: str) -> str:
     """Shorthand for getting translated text using session state language."""
     import streamlit as st
     lang = st.session_state.get("language", "en")
-    return get_text(key, lang)
+    return _BUNDLES.get(lang, _BUNDLES["en"]).get(key, key)